@@ -3,13 +3,19 @@ import sys
 import time
 import hmac
 import hashlib
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import duckdb
+import numpy as np
 import logging
-import statistics
 import math
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timezone
+import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from config_loader import CONFIG
 from woox_errors import (
     handle_api_error,
@@ -17,12 +23,381 @@ from woox_errors import (
     ErrorFormatter
 )
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib parser
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional speedup; the P&L walk runs as plain Python
+    njit = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# hashlib hands SHA-256 to OpenSSL (which uses the CPU's SHA extensions where
+# present) when the _hashlib module is available; minimal images without it
+# fall back to CPython's much slower built-in implementation
+_HASHLIB_OPENSSL = getattr(hashlib.sha256, '__module__', '') == '_hashlib'
+if not _HASHLIB_OPENSSL:
+    logging.getLogger('Account').warning(
+        "hashlib is not backed by OpenSSL; request signing uses the slow built-in SHA-256"
+    )
+
+# Single-scan aggregate for the old (paper) schema; win/loss predicates are
+# substituted so legacy tables without realized_pnl can fall back to signals.
+_OLD_SCHEMA_SUMMARY_SQL = """
+    SELECT 
+        COUNT(*),
+        COUNT(*) FILTER (WHERE trade_type = 'BUY'),
+        SUM(quantity) FILTER (WHERE trade_type = 'BUY'),
+        SUM(proceeds) FILTER (WHERE trade_type = 'BUY'),
+        COUNT(*) FILTER (WHERE trade_type = 'SELL'),
+        SUM(ABS(quantity)) FILTER (WHERE trade_type = 'SELL'),
+        SUM(proceeds) FILTER (WHERE trade_type = 'SELL'),
+        SUM(proceeds),
+        SUM(quantity),
+        COUNT(*) FILTER (WHERE {win}),
+        COUNT(*) FILTER (WHERE {loss})
+    FROM trades
+"""
+
+_OLD_SCHEMA_WIN_LOSS = {
+    'win': "realized_pnl > 0 OR (realized_pnl = 0 AND signal = 'TAKE_PROFIT')",
+    'loss': "realized_pnl < 0 OR (realized_pnl = 0 AND signal = 'STOP_LOSS')",
+}
+
+_LEGACY_WIN_LOSS = {
+    'win': "signal = 'TAKE_PROFIT'",
+    'loss': "signal = 'STOP_LOSS'",
+}
+
+# Recent trades for both schemas project the same columns, in this order
+RECENT_TRADE_COLUMNS = ('symbol', 'trade_datetime', 'trade_type', 'quantity', 'price', 'proceeds', 'code')
+
+_OLD_SCHEMA_RECENT_SQL = """
+    SELECT symbol, trade_datetime, trade_type, quantity, price, proceeds, code
+    FROM trades 
+    ORDER BY trade_datetime DESC 
+    LIMIT 10
+"""
+
+# Net positions smaller than this are float residue from summing fractional
+# fills (e.g. 0.1 + 0.2 - 0.3) and count as flat
+_FLAT_POSITION_EPSILON = 1e-12
+
+# Filled trades in execution order for the summary and FIFO P&L walk, reduced
+# to the columns they need. Price falls back to the order price when the
+# average executed price is missing or zero. The signed net position before
+# each fill comes from a running sum, so Python only has to carry the average
+# entry price.
+_NEW_SCHEMA_FILLED_SQL = f"""
+    WITH filled AS (
+        SELECT 
+            created_time,
+            order_id,
+            COALESCE(executed_quantity, 0) AS qty,
+            COALESCE(NULLIF(average_executed_price, 0), NULLIF(order_price, 0), 0) AS price,
+            CASE WHEN side = 'BUY' THEN 1 ELSE -1 END AS direction
+        FROM trades 
+        WHERE status = 'FILLED'
+    ),
+    positioned AS (
+        SELECT 
+            created_time,
+            order_id,
+            qty,
+            price,
+            direction,
+            COALESCE(SUM(direction * qty) OVER (
+                ORDER BY created_time, order_id
+                ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+            ), 0) AS prev_position
+        FROM filled
+    )
+    SELECT 
+        qty,
+        price,
+        direction,
+        CASE WHEN abs(prev_position) < {_FLAT_POSITION_EPSILON} THEN 0 ELSE prev_position END AS prev_position
+    FROM positioned
+    ORDER BY created_time, order_id
+"""
+
+# Mapped onto the old schema's conventions: sells carry negative quantity,
+# buys negative proceeds, and reduce-only orders are closing ('C') trades
+_NEW_SCHEMA_RECENT_SQL = """
+    WITH recent AS (
+        SELECT 
+            symbol,
+            updated_time,
+            side,
+            COALESCE(executed_quantity, 0) AS qty,
+            COALESCE(NULLIF(average_executed_price, 0), NULLIF(order_price, 0), 0) AS price,
+            reduce_only
+        FROM trades 
+        WHERE status = 'FILLED'
+        ORDER BY updated_time DESC 
+        LIMIT 10
+    )
+    SELECT 
+        symbol,
+        updated_time AS trade_datetime,
+        side AS trade_type,
+        CASE WHEN side = 'SELL' AND qty > 0 THEN -qty ELSE qty END AS quantity,
+        price,
+        CASE WHEN side = 'BUY' THEN -qty * price ELSE qty * price END AS proceeds,
+        CASE WHEN reduce_only THEN 'C' ELSE 'O' END AS code
+    FROM recent
+    ORDER BY updated_time DESC
+"""
+
+# Net position per symbol (old paper schema)
+_OPEN_POSITIONS_SQL = """
+    SELECT 
+        symbol,
+        SUM(quantity) as net_quantity,
+        AVG(price) as avg_entry_price,
+        COUNT(*) as trade_count
+    FROM trades
+    GROUP BY symbol
+    HAVING SUM(quantity) != 0
+"""
+
+# Same rows from the per-symbol aggregate table createDuckDB.init_db builds
+# and Trade keeps current on every paper trade, without scanning trades
+_OPEN_POSITIONS_AGG_SQL = """
+    SELECT 
+        symbol,
+        net_quantity,
+        price_sum / trade_count as avg_entry_price,
+        trade_count
+    FROM positions_agg
+    WHERE net_quantity != 0
+"""
+
+# Open positions joined against a VALUES table of current prices so the
+# unrealized P&L is computed by DuckDB rather than row by row in Python
+_POSITIONS_PNL_SQL = """
+    WITH positions AS ({positions}),
+    prices AS (
+        SELECT * FROM (VALUES {values}) AS cp(symbol, price)
+    )
+    SELECT 
+        p.symbol,
+        p.net_quantity,
+        p.avg_entry_price,
+        p.trade_count,
+        cp.price,
+        (cp.price - p.avg_entry_price) * p.net_quantity,
+        (cp.price - p.avg_entry_price) / NULLIF(p.avg_entry_price, 0) * 100
+    FROM positions p
+    LEFT JOIN prices cp USING (symbol)
+    ORDER BY p.symbol
+"""
+
+# Row layout for the recent trades table in display_account_summary
+_RECENT_TRADE_ROW_FMT = '  {dt:<20} {sym:<15} {tp:<6} {qty:>10.6f} ${px:>10.2f} {code:<5}'
+
+# Process-wide DuckDB connections keyed by (database file, read_only). Each
+# Account works through its own cursor, since a single cursor must not be
+# shared across threads.
+_DB_SINGLETONS: Dict[Tuple[str, bool], duckdb.DuckDBPyConnection] = {}
+# Number of open Accounts using each shared connection; the connection (and
+# its file lock) is closed when the last of them closes
+_DB_REFCOUNTS: Dict[Tuple[str, bool], int] = {}
+_DB_SINGLETONS_LOCK = threading.Lock()
+
+
+def _get_conn(trade_mode: str, read_only: bool = False) -> duckdb.DuckDBPyConnection:
+    """
+    Get the shared DuckDB connection for a trade mode, opening it on first use.
+    
+    Every call takes a reference that must be handed back with _release_conn;
+    the connection is closed once no Account holds it, so the file lock isn't
+    kept for the life of the process.
+    
+    Read-only callers (balance_summary, the account CLI) get a read-only
+    connection, so several of them can read the file at once. It still takes
+    a shared file lock, and while any reader holds it a read-write open from
+    another process (e.g. Trade recording a paper trade) fails, so readers
+    should release their Account as soon as they have their rows. The
+    read-write connection is only opened for callers that ask for it, i.e.
+    processes that also host Trade or OrderHistorySync (the dashboard);
+    DuckDB lets a single process write to a file, and in those processes it
+    is the one doing the writing.
+    
+    DuckDB refuses read-only and read-write connections to the same file
+    within one process, so a read-only request reuses an existing
+    read-write connection, and falls back to read-write if the read-only
+    open fails (e.g. the file doesn't exist yet). A read-write request in a
+    process that already holds a read-only connection raises, since that
+    process was set up as a reader.
+    
+    Args:
+        trade_mode: 'paper' or 'live'
+        read_only: Open the database read-only
+        
+    Returns:
+        Process-wide DuckDB connection for the mode's database file
+    """
+    db_file = 'live_transaction.db' if trade_mode == 'live' else 'paper_transaction.db'
+    path = os.path.abspath(db_file)
+    
+    with _DB_SINGLETONS_LOCK:
+        if read_only:
+            for key in ((path, True), (path, False)):
+                if key in _DB_SINGLETONS:
+                    _DB_REFCOUNTS[key] += 1
+                    return _DB_SINGLETONS[key]
+            try:
+                conn = duckdb.connect(db_file, read_only=True)
+                _DB_SINGLETONS[(path, True)] = conn
+                _DB_REFCOUNTS[(path, True)] = 1
+                return conn
+            except duckdb.Error as e:
+                logging.getLogger('Account').warning(
+                    "Read-only open of %s failed (%s), using read-write", db_file, str(e)
+                )
+        
+        key = (path, False)
+        if key not in _DB_SINGLETONS:
+            # Use read_only=False to match Trade's connection config and avoid conflicts
+            _DB_SINGLETONS[key] = duckdb.connect(db_file, read_only=False)
+            _DB_REFCOUNTS[key] = 0
+        _DB_REFCOUNTS[key] += 1
+        return _DB_SINGLETONS[key]
+
+
+def _release_conn(conn: duckdb.DuckDBPyConnection) -> None:
+    """
+    Hand back a reference taken by _get_conn, closing the connection after the last one.
+    
+    Args:
+        conn: Connection returned by _get_conn
+    """
+    with _DB_SINGLETONS_LOCK:
+        for key, shared in _DB_SINGLETONS.items():
+            if shared is conn:
+                _DB_REFCOUNTS[key] -= 1
+                if _DB_REFCOUNTS[key] <= 0:
+                    del _DB_SINGLETONS[key]
+                    del _DB_REFCOUNTS[key]
+                    conn.close()
+                return
+
+
+# Recent API responses shared by all Account instances (the dashboard creates
+# a new Account per callback), keyed by method, endpoint host and credentials
+_API_CACHE: Dict[tuple, tuple] = {}
+
+# How long balance, account info and mark price responses are reused (seconds)
+_ACCOUNT_CACHE_SECONDS = float(CONFIG.get('ACCOUNT_CACHE_SECONDS', 2))
+
+
+def _ttl_cache(seconds: float = 2.0):
+    """
+    Decorator to reuse an API method's result for a short time window.
+    
+    Balances change on a scale of seconds, so repeated dashboard refreshes
+    within the window are served from memory instead of another HTTPS call
+    (which also keeps clear of WOOX rate limits). Failed calls (None) are
+    not cached.
+    
+    Args:
+        seconds: How long a result stays valid
+    
+    Example:
+        @_ttl_cache(seconds=_ACCOUNT_CACHE_SECONDS)  # ACCOUNT_CACHE_SECONDS in .config
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (func.__name__, self.base_url, self.api_key, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            cached = _API_CACHE.get(key)
+            if cached is not None and now - cached[0] < seconds:
+                return cached[1]
+            
+            result = func(self, *args, **kwargs)
+            if result is not None:
+                _API_CACHE[key] = (now, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def parse_json(content: bytes) -> Any:
+    """Decode an API response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _average_entry_prices(qty: np.ndarray, price: np.ndarray, prev_position: np.ndarray,
+                          net_position: np.ndarray, closing: np.ndarray) -> np.ndarray:
+    """
+    Average entry price of the open position after each fill.
+    
+    Opening and increasing fills re-weight the average; closing fills leave it
+    unchanged unless they flip the position, which restarts it at the fill price.
+    
+    Args:
+        qty: Absolute fill quantities
+        price: Fill prices
+        prev_position: Signed net position before each fill
+        net_position: Signed net position after each fill
+        closing: True where the fill reduces the position
+        
+    Returns:
+        Array of average entry prices, one per fill
+    """
+    avg = np.empty_like(price)
+    current = 0.0
+    for i in range(len(price)):
+        if not closing[i]:
+            if prev_position[i] == 0:
+                current = price[i]
+            else:
+                current = (abs(prev_position[i]) * current + qty[i] * price[i]) / abs(net_position[i])
+        elif qty[i] > abs(prev_position[i]):
+            current = price[i]
+        avg[i] = current
+    return avg
+
+
+if njit is not None:
+    _average_entry_prices = njit(cache=True)(_average_entry_prices)
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a keep-alive HTTP session for WOOX REST calls.
+    
+    Pooled connections reuse the TLS handshake across requests; transient
+    gateway errors and rate limits are retried with a short backoff.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
 
 class Account:
     """
@@ -30,7 +405,8 @@ class Account:
     Displays balance and P&L from database transactions and API account info.
     """
     
-    def __init__(self, trade_mode: str = 'paper', api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    def __init__(self, trade_mode: str = 'paper', api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 read_only: bool = False):
         """
         Initialize the Account class.
         
@@ -38,22 +414,65 @@ class Account:
             trade_mode: 'paper' or 'live'
             api_key: WOOX API key (optional)
             api_secret: WOOX API secret (optional)
+            read_only: Open the database read-only (for stand-alone readers that
+                don't share the process with Trade or the order history sync)
         """
         self.logger = logging.getLogger('Account')
         self.trade_mode = trade_mode
         self.api_key = os.environ.get('WOOX_API_KEY')
         self.api_secret = os.environ.get('WOOX_API_SECRET')
         self.base_url = CONFIG.get('BASE_URL', 'https://api.woox.io')
-        self.db_lock = None
         
-        # Connect to appropriate database
-        # Use read_only=False to match Trade's connection config and avoid conflicts
-        # Create a new connection for thread safety
-        db_file = 'live_transaction.db' if trade_mode == 'live' else 'paper_transaction.db'
-        self.db_conn = duckdb.connect(db_file, read_only=False)
+        # Pre-keyed HMAC state; copying it skips the key pad setup on every signature
+        self._api_secret_bytes = self.api_secret.encode('utf-8') if self.api_secret else None
+        self._hmac_template = (
+            hmac.new(self._api_secret_bytes, b'', hashlib.sha256) if self._api_secret_bytes else None
+        )
+        
+        # Shared connection for the appropriate database, taken on the first
+        # query so API-only use doesn't hold the file lock; each thread that
+        # touches it gets its own cursor (see db_conn), so no lock is needed
+        self._read_only = read_only
+        self._conn: Optional[duckdb.DuckDBPyConnection] = None
+        self._tls = threading.local()
+        self._cursors: List[duckdb.DuckDBPyConnection] = []
+        self._cursors_lock = threading.Lock()
+        
+        # Schema flavour (old paper vs new API schema), probed once on first use
+        self._is_new_schema: Optional[bool] = None
+        self._has_positions_agg: Optional[bool] = None
+        
+        # Keep-alive HTTP session for API calls
+        self._session = _build_session()
+        
+        # Worker threads for issuing independent API calls concurrently
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='account-io')
         
         self.logger.info("Account initialized in %s mode", trade_mode.upper())
 
+    @property
+    def db_conn(self) -> duckdb.DuckDBPyConnection:
+        """Database cursor for the calling thread, created on first use."""
+        cursor = getattr(self._tls, 'cursor', None)
+        if cursor is None:
+            with self._cursors_lock:
+                if self._conn is None:
+                    self._conn = _get_conn(self.trade_mode, read_only=self._read_only)
+                cursor = self._conn.cursor()
+                self._cursors.append(cursor)
+            self._tls.cursor = cursor
+            # Names of statements already prepared on this cursor
+            self._tls.prepared = set()
+        return cursor
+    
+    def _close_cursors(self) -> None:
+        """Close every cursor handed out by db_conn."""
+        with self._cursors_lock:
+            cursors, self._cursors = self._cursors, []
+        for cursor in cursors:
+            cursor.close()
+        self._tls = threading.local()
+    
     def __enter__(self):
         return self
 
@@ -65,17 +484,20 @@ class Account:
         if not self.api_secret:
             raise ValueError("API secret is required for authenticated requests")
         
-        sign_string = str(timestamp) + method + request_path + body
-        signature = hmac.new(
-            bytes(self.api_secret, 'utf-8'),
-            bytes(sign_string, 'utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        # Sign one pre-encoded buffer; body may already be bytes
+        payload = b'%d%s%s%s' % (
+            timestamp,
+            method.encode('utf-8'),
+            request_path.encode('utf-8'),
+            body if isinstance(body, bytes) else body.encode('utf-8'),
+        )
+        mac = self._hmac_template.copy()
+        mac.update(payload)
+        return mac.hexdigest()
     
     def _get_auth_headers(self, method: str, request_path: str, body: str = "") -> Dict[str, str]:
         """Generate authentication headers for API requests."""
-        timestamp = round(time.time() * 1000)
+        timestamp = time.time_ns() // 1_000_000  # Integer milliseconds, no float round-trip
         signature = self._generate_signature(timestamp, method, request_path, body)
         
         headers = {
@@ -90,6 +512,7 @@ class Account:
         
         return headers
     
+    @_ttl_cache(seconds=_ACCOUNT_CACHE_SECONDS)
     def get_api_balance(self) -> Optional[Dict[str, Any]]:
         """
         Get account balance from WOOX API.
@@ -105,13 +528,13 @@ class Account:
             request_path = "/v3/balances"
             headers = self._get_auth_headers('GET', request_path)
             
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}{request_path}",
                 headers=headers,
                 timeout=10
             )
             
-            response_data = response.json()
+            response_data = parse_json(response.content)
             
             # Handle API errors
             handle_api_error(response_data, self.logger)
@@ -128,6 +551,7 @@ class Account:
             self.logger.error("Error fetching API balance: %s", str(e))
             return None
 
+    @_ttl_cache(seconds=_ACCOUNT_CACHE_SECONDS)
     def get_account_info(self) -> Optional[Dict[str, Any]]:
         """
         Get account information from WOOX API (V3).
@@ -144,13 +568,13 @@ class Account:
             request_path = "/v3/accountinfo"
             headers = self._get_auth_headers('GET', request_path)
             
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}{request_path}",
                 headers=headers,
                 timeout=10
             )
             
-            response_data = response.json()
+            response_data = parse_json(response.content)
             handle_api_error(response_data, self.logger)
             
             if response_data.get('success'):
@@ -162,6 +586,72 @@ class Account:
             self.logger.error("Error fetching account info: %s", str(e))
             return None
     
+    def _execute_prepared(self, name: str, sql: str) -> duckdb.DuckDBPyConnection:
+        """
+        Execute a static query through a prepared statement on this cursor.
+        
+        The statement is prepared on first use so DuckDB parses and plans it
+        once; later calls only run EXECUTE.
+        
+        Args:
+            name: Prepared statement name (unique per query text)
+            sql: Query to prepare
+            
+        Returns:
+            Cursor holding the query result
+        """
+        cursor = self.db_conn
+        if name not in self._tls.prepared:
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            self._tls.prepared.add(name)
+        return cursor.execute(f"EXECUTE {name}")
+    
+    @_ttl_cache(seconds=_ACCOUNT_CACHE_SECONDS)
+    def fetch_mark_price(self, symbol: str) -> Optional[float]:
+        """
+        Get the last traded price for a symbol from the public API.
+        
+        Args:
+            symbol: Trading symbol (e.g., SPOT_BTC_USDT)
+            
+        Returns:
+            Last trade price or None if unavailable
+        """
+        try:
+            response = self._session.get(
+                f"{self.base_url}/v3/public/marketTrades",
+                params={'symbol': symbol, 'limit': 1},
+                timeout=10
+            )
+            if response.status_code != 200:
+                return None
+            
+            data = parse_json(response.content)
+            if data.get('success'):
+                trades = data.get('data', {}).get('rows', [])
+                if trades:
+                    return float(trades[0].get('price', 0))
+            
+            return None
+            
+        except Exception as e:
+            self.logger.warning("Could not fetch current price for %s: %s", symbol, str(e))
+            return None
+    
+    def fetch_mark_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get last traded prices for several symbols concurrently.
+        
+        Args:
+            symbols: Trading symbols
+            
+        Returns:
+            Dictionary mapping symbol to price (symbols without a price are omitted)
+        """
+        futures = {symbol: self._io_pool.submit(self.fetch_mark_price, symbol) for symbol in symbols}
+        prices = {symbol: future.result() for symbol, future in futures.items()}
+        return {symbol: price for symbol, price in prices.items() if price is not None}
+    
     def get_transaction_summary(self, current_price: float = None) -> Dict[str, Any]:
         """
         Get transaction summary from database.
@@ -174,15 +664,13 @@ class Account:
             Dictionary with transaction statistics
         """
         try:
-            # Check which schema we're using
-            schema_check = self.db_conn.execute("""
-                SELECT COUNT(*) FROM information_schema.columns 
-                WHERE table_name = 'trades' AND column_name = 'order_id'
-            """).fetchone()
-            
-            is_new_schema = schema_check[0] > 0 if schema_check else False
+            # Check which schema we're using (cached for the connection's lifetime)
+            if self._is_new_schema is None:
+                # Direct catalog lookup of one table instead of scanning information_schema
+                columns = {row[0] for row in self.db_conn.execute("DESCRIBE trades").fetchall()}
+                self._is_new_schema = 'order_id' in columns
             
-            if is_new_schema:
+            if self._is_new_schema:
                 # New schema from WOO X API (live mode)
                 return self._get_summary_new_schema(current_price)
             else:
@@ -196,135 +684,62 @@ class Account:
     def _get_summary_new_schema(self, current_price: float = None) -> Dict[str, Any]:
         """Get summary from new WOO X API schema with manual PnL calculation."""
         try:
-            # Fetch all filled trades sorted by time for FIFO calculation
-            trades = self.db_conn.execute("""
-                SELECT * FROM trades 
-                WHERE status = 'FILLED' 
-                ORDER BY created_time ASC
-            """).fetchall()
-            
-            # Get column names
-            columns = [desc[0] for desc in self.db_conn.description]
-            trades_data = [dict(zip(columns, row)) for row in trades]
-            
-            total_trades = len(trades_data)
-            buy_count = 0
-            sell_count = 0
-            buy_qty = 0.0
-            sell_qty = 0.0
-            buy_value = 0.0
-            sell_value = 0.0
-            
-            realized_pnl = 0.0
-            winning_trades = 0
-            losing_trades = 0
-            
-            # Metrics tracking
-            trade_pnls = []
-            equity_curve = [0.0] # Start at 0 PnL
-            
-            # Position tracking for FIFO
-            position = {'quantity': 0.0, 'avg_price': 0.0, 'side': None}
-            
-            for t in trades_data:
-                side = t.get('side')
-                qty = float(t.get('executed_quantity') or 0)
-                price = float(t.get('average_executed_price') or t.get('order_price') or 0)
-                value = qty * price
-                
-                if side == 'BUY':
-                    buy_count += 1
-                    buy_qty += qty
-                    buy_value += value
-                else:
-                    sell_count += 1
-                    sell_qty += qty
-                    sell_value += value
-                
-                if qty == 0:
-                    continue
-                    
-                trade_pnl = 0.0
-                
-                if position['quantity'] == 0:
-                    # Opening new position
-                    position['quantity'] = qty
-                    position['avg_price'] = price
-                    position['side'] = 'LONG' if side == 'BUY' else 'SHORT'
-                    
-                elif (side == 'BUY' and position['side'] == 'LONG') or (side == 'SELL' and position['side'] == 'SHORT'):
-                    # Increasing position
-                    total_cost = (position['quantity'] * position['avg_price']) + (qty * price)
-                    position['quantity'] += qty
-                    position['avg_price'] = total_cost / position['quantity']
-                    
-                elif (side == 'BUY' and position['side'] == 'SHORT') or (side == 'SELL' and position['side'] == 'LONG'):
-                    # Closing position
-                    close_qty = min(qty, position['quantity'])
-                    
-                    if position['side'] == 'LONG': # Selling to close Long
-                        trade_pnl = (price - position['avg_price']) * close_qty
-                    else: # Buying to close Short
-                        trade_pnl = (position['avg_price'] - price) * close_qty
-                        
-                    realized_pnl += trade_pnl
-                    
-                    # Track metrics
-                    trade_pnls.append(trade_pnl)
-                    equity_curve.append(realized_pnl)
-                    
-                    # Count win/loss
-                    if trade_pnl > 0:
-                        winning_trades += 1
-                    elif trade_pnl < 0:
-                        losing_trades += 1
-                        
-                    position['quantity'] -= close_qty
-                    
-                    # If flipping position
-                    remaining_qty = qty - close_qty
-                    if remaining_qty > 0:
-                        position['quantity'] = remaining_qty
-                        position['avg_price'] = price
-                        position['side'] = 'LONG' if side == 'BUY' else 'SHORT'
+            # Filled trades in execution order with the net position before each fill
+            fills = self._execute_prepared('new_filled_trades', _NEW_SCHEMA_FILLED_SQL).fetchnumpy()
+            qty = fills['qty']
+            price = fills['price']
+            prev_position = fills['prev_position']
+            is_buy = fills['direction'] > 0
+            net_position = prev_position + fills['direction'] * qty
+            net_position[np.abs(net_position) < _FLAT_POSITION_EPSILON] = 0.0
+            
+            # Buy/sell totals as masked reductions over the same arrays
+            value = qty * price
+            total_trades = len(qty)
+            buy_count = int(is_buy.sum())
+            buy_qty = float(qty[is_buy].sum())
+            buy_value = float(value[is_buy].sum())
+            sell_count = total_trades - buy_count
+            sell_qty = float(qty[~is_buy].sum())
+            sell_value = float(value[~is_buy].sum())
+            
+            # A fill closes (part of) the position when it trades against its sign
+            closing = (qty > 0) & (prev_position != 0) & ((prev_position > 0) != is_buy)
+            close_qty = np.minimum(qty, np.abs(prev_position))
+            
+            avg_after = _average_entry_prices(qty, price, prev_position, net_position, closing)
+            avg_before = np.concatenate(([0.0], avg_after[:-1]))
+            
+            # Realized P&L of each closing fill against the average entry price
+            trade_pnls = ((price - avg_before) * close_qty * np.sign(prev_position))[closing]
+            realized_pnl = float(trade_pnls.sum())
+            winning_trades = int((trade_pnls > 0).sum())
+            losing_trades = int((trade_pnls < 0).sum())
+            equity_curve = np.concatenate(([0.0], np.cumsum(trade_pnls))) # Start at 0 PnL
             
             # Calculate unrealized P&L based on remaining position
+            net_quantity = float(net_position[-1]) if len(net_position) else 0.0
             unrealized_pnl = 0.0
-            net_quantity = position['quantity'] if position['side'] == 'LONG' else -position['quantity']
-            
-            if current_price and position['quantity'] > 0:
-                if position['side'] == 'LONG':
-                    unrealized_pnl = (current_price - position['avg_price']) * position['quantity']
-                else:
-                    unrealized_pnl = (position['avg_price'] - current_price) * position['quantity']
+            if current_price and net_quantity != 0:
+                unrealized_pnl = (current_price - float(avg_after[-1])) * net_quantity
             
             total_pnl = realized_pnl + unrealized_pnl
             
             # Calculate Sharpe Ratio
             sharpe_ratio = 0.0
             if len(trade_pnls) > 1:
-                avg_pnl = statistics.mean(trade_pnls)
-                stdev_pnl = statistics.stdev(trade_pnls)
+                avg_pnl = float(trade_pnls.mean())
+                stdev_pnl = float(trade_pnls.std(ddof=1))
                 if stdev_pnl > 0:
                     sharpe_ratio = avg_pnl / stdev_pnl
             
             # Calculate Max Drawdown (Absolute)
-            max_drawdown = 0.0
-            peak = -float('inf')
-            for equity in equity_curve:
-                if equity > peak:
-                    peak = equity
-                drawdown = peak - equity
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
+            running_peak = np.maximum.accumulate(equity_curve)
+            max_drawdown = float((running_peak - equity_curve).max())
+            peak = float(running_peak[-1])
             
             # Recent trades (last 10)
-            recent_trades = self.db_conn.execute("""
-                SELECT * FROM trades 
-                WHERE status = 'FILLED'
-                ORDER BY updated_time DESC 
-                LIMIT 10
-            """).fetchall()
+            recent_trades = self._execute_prepared('new_recent_trades', _NEW_SCHEMA_RECENT_SQL).fetchall()
             
             return {
                 'total_trades': total_trades,
@@ -353,47 +768,23 @@ class Account:
     def _get_summary_old_schema(self, current_price: float = None) -> Dict[str, Any]:
         """Get summary from old paper trading schema."""
         try:
-            # Total transactions
-            count_cursor = self.db_conn.execute("""
-                SELECT COUNT(*) as count FROM trades
-            """)
-            count_row = count_cursor.fetchone()
-            total_trades = count_row[0] if count_row else 0
-            
-            # Total buy and sell volumes
-            buy_cursor = self.db_conn.execute("""
-                SELECT 
-                    COUNT(*) as count,
-                    SUM(quantity) as total_quantity,
-                    SUM(proceeds) as total_proceeds
-                FROM trades 
-                WHERE trade_type = 'BUY'
-            """)
-            buy_summary = buy_cursor.fetchone()
-            
-            sell_cursor = self.db_conn.execute("""
-                SELECT 
-                    COUNT(*) as count,
-                    SUM(ABS(quantity)) as total_quantity,
-                    SUM(proceeds) as total_proceeds
-                FROM trades 
-                WHERE trade_type = 'SELL'
-            """)
-            sell_summary = sell_cursor.fetchone()
-            
-            # Net P&L (Cash Flow)
-            pnl_cursor = self.db_conn.execute("""
-                SELECT SUM(proceeds) as net_pnl FROM trades
-            """)
-            pnl_row = pnl_cursor.fetchone()
-            cash_pnl = pnl_row[0] if pnl_row and pnl_row[0] is not None else 0.0
-            
-            # Net Quantity (Current Position)
-            qty_cursor = self.db_conn.execute("""
-                SELECT SUM(quantity) as net_qty FROM trades
-            """)
-            qty_row = qty_cursor.fetchone()
-            net_quantity = qty_row[0] if qty_row and qty_row[0] is not None else 0.0
+            # All aggregates in a single scan of the trades table
+            try:
+                row = self._execute_prepared(
+                    'old_summary', _OLD_SCHEMA_SUMMARY_SQL.format(**_OLD_SCHEMA_WIN_LOSS)
+                ).fetchone()
+            except Exception:
+                # Fallback if realized_pnl column doesn't exist (shouldn't happen after migration)
+                row = self._execute_prepared(
+                    'old_summary_legacy', _OLD_SCHEMA_SUMMARY_SQL.format(**_LEGACY_WIN_LOSS)
+                ).fetchone()
+            
+            (total_trades, buy_count, buy_qty, buy_proc,
+             sell_count, sell_qty, sell_proc,
+             cash_pnl, net_quantity, winning_trades, losing_trades) = row
+            
+            cash_pnl = cash_pnl if cash_pnl is not None else 0.0
+            net_quantity = net_quantity if net_quantity is not None else 0.0
             
             # Calculate Total P&L (Realized + Unrealized)
             total_pnl = cash_pnl
@@ -409,52 +800,11 @@ class Account:
                 # then adding current value gives the total result.
                 # So total_pnl is the correct "Account P&L".
             
-            # Winning trades (Positive PnL or TAKE_PROFIT for legacy)
-            # Now using realized_pnl column if available
-            try:
-                win_cursor = self.db_conn.execute("""
-                    SELECT COUNT(*) FROM trades 
-                    WHERE realized_pnl > 0 OR (realized_pnl = 0 AND signal = 'TAKE_PROFIT')
-                """)
-            except:
-                # Fallback if column doesn't exist (shouldn't happen after migration)
-                win_cursor = self.db_conn.execute("""
-                    SELECT COUNT(*) FROM trades WHERE signal = 'TAKE_PROFIT'
-                """)
-            win_row = win_cursor.fetchone()
-            winning_trades = win_row[0] if win_row else 0
-            
-            # Losing trades (Negative PnL or STOP_LOSS for legacy)
-            try:
-                loss_cursor = self.db_conn.execute("""
-                    SELECT COUNT(*) FROM trades 
-                    WHERE realized_pnl < 0 OR (realized_pnl = 0 AND signal = 'STOP_LOSS')
-                """)
-            except:
-                loss_cursor = self.db_conn.execute("""
-                    SELECT COUNT(*) FROM trades WHERE signal = 'STOP_LOSS'
-                """)
-            loss_row = loss_cursor.fetchone()
-            losing_trades = loss_row[0] if loss_row else 0
-            
             # Recent trades
-            recent_trades = self.db_conn.execute("""
-                SELECT * FROM trades 
-                ORDER BY trade_datetime DESC 
-                LIMIT 10
-            """).fetchall()
-            
-            # Handle potential None results from empty tables
-            buy_count = buy_summary[0] if buy_summary else 0
-            buy_qty = buy_summary[1] if buy_summary and len(buy_summary) > 1 else 0.0
-            buy_proc = buy_summary[2] if buy_summary and len(buy_summary) > 2 else 0.0
-            
-            sell_count = sell_summary[0] if sell_summary else 0
-            sell_qty = sell_summary[1] if sell_summary and len(sell_summary) > 1 else 0.0
-            sell_proc = sell_summary[2] if sell_summary and len(sell_summary) > 2 else 0.0
+            recent_trades = self._execute_prepared('old_recent_trades', _OLD_SCHEMA_RECENT_SQL).fetchall()
             
             return {
-                'total_trades': total_trades,
+                'total_trades': total_trades or 0,
                 'buy_count': buy_count or 0,
                 'buy_quantity': buy_qty or 0.0,
                 'buy_proceeds': buy_proc or 0.0,
@@ -465,8 +815,8 @@ class Account:
                 'cash_pnl': round(cash_pnl, 2), # Raw cash flow
                 'unrealized_pnl': round(unrealized_pnl, 2),
                 'net_quantity': net_quantity,
-                'winning_trades': winning_trades,
-                'losing_trades': losing_trades,
+                'winning_trades': winning_trades or 0,
+                'losing_trades': losing_trades or 0,
                 'recent_trades': recent_trades
             }
             
@@ -474,6 +824,22 @@ class Account:
             self.logger.error("Error getting transaction summary: %s", str(e))
             return {}
     
+    def _open_positions_sql(self) -> tuple:
+        """
+        Pick the open-positions query for this database.
+        
+        Returns:
+            (statement name, SQL) reading the maintained positions_agg table
+            when the database has one, otherwise aggregating trades directly
+        """
+        if self._has_positions_agg is None:
+            self._has_positions_agg = self.db_conn.execute(
+                "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'positions_agg'"
+            ).fetchone()[0] > 0
+        if self._has_positions_agg:
+            return 'open_positions_agg', _OPEN_POSITIONS_AGG_SQL
+        return 'open_positions', _OPEN_POSITIONS_SQL
+    
     def get_open_positions(self) -> List[Dict[str, Any]]:
         """
         Get currently open positions (BUY without matching SELL).
@@ -483,16 +849,7 @@ class Account:
         """
         try:
             # Find open positions by matching BUY orders without SELL
-            open_positions = self.db_conn.execute("""
-                SELECT 
-                    symbol,
-                    SUM(quantity) as net_quantity,
-                    AVG(price) as avg_entry_price,
-                    COUNT(*) as trade_count
-                FROM trades
-                GROUP BY symbol
-                HAVING SUM(quantity) != 0
-            """).fetchall()
+            open_positions = self._execute_prepared(*self._open_positions_sql()).fetchall()
             
             positions = []
             for pos in open_positions:
@@ -509,6 +866,47 @@ class Account:
             self.logger.error("Error getting open positions: %s", str(e))
             return []
     
+    def _get_positions_with_pnl(self, current_prices: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """
+        Get open positions with current price and unrealized P&L in one query.
+        
+        Args:
+            current_prices: Optional dictionary mapping symbol to current price
+            
+        Returns:
+            List of open position dictionaries; price fields are None for
+            symbols without a current price
+        """
+        try:
+            if current_prices:
+                values = ", ".join(["(?::VARCHAR, ?::DOUBLE)"] * len(current_prices))
+                params = [item for pair in current_prices.items() for item in pair]
+            else:
+                values = "(NULL::VARCHAR, NULL::DOUBLE)"
+                params = []
+            
+            _, positions_sql = self._open_positions_sql()
+            rows = self.db_conn.execute(
+                _POSITIONS_PNL_SQL.format(positions=positions_sql, values=values), params
+            ).fetchall()
+            
+            return [
+                {
+                    'symbol': row[0],
+                    'quantity': row[1],
+                    'avg_entry_price': row[2],
+                    'trade_count': row[3],
+                    'current_price': row[4],
+                    'unrealized_pnl': row[5],
+                    'pnl_pct': row[6]
+                }
+                for row in rows
+            ]
+            
+        except Exception as e:
+            self.logger.error("Error getting open positions: %s", str(e))
+            return []
+    
     def calculate_unrealized_pnl(self, current_prices: Dict[str, float]) -> Dict[str, float]:
         """
         Calculate unrealized P&L for open positions.
@@ -519,20 +917,15 @@ class Account:
         Returns:
             Dictionary with unrealized P&L per symbol
         """
-        open_positions = self.get_open_positions()
-        unrealized_pnl = {}
-        
-        for pos in open_positions:
-            symbol = pos['symbol']
-            quantity = pos['quantity']
-            entry_price = pos['avg_entry_price']
-            
-            if symbol in current_prices:
-                current_price = current_prices[symbol]
-                pnl = (current_price - entry_price) * quantity
-                unrealized_pnl[symbol] = pnl
+        if not current_prices:
+            return {}
         
-        return unrealized_pnl
+        # Price join and arithmetic run inside DuckDB
+        return {
+            pos['symbol']: pos['unrealized_pnl']
+            for pos in self._get_positions_with_pnl(current_prices)
+            if pos['current_price'] is not None
+        }
     
     def display_account_summary(self, current_prices: Optional[Dict[str, float]] = None):
         """
@@ -541,83 +934,107 @@ class Account:
         Args:
             current_prices: Optional dictionary of current market prices
         """
-        print("\n" + "="*80)
-        print(f"ACCOUNT SUMMARY - {self.trade_mode.upper()} MODE")
-        print("="*80)
+        # The local DuckDB summary doesn't depend on the API calls below, so it
+        # runs on the I/O pool (with its own cursor) while they are in flight
+        summary_future = self._io_pool.submit(self.get_transaction_summary)
+        
+        # Report lines, written to stdout in one go at the end
+        out = [
+            "\n" + "="*80,
+            f"ACCOUNT SUMMARY - {self.trade_mode.upper()} MODE",
+            "="*80,
+        ]
         
         # API Balance (if available)
         if self.trade_mode == 'live' and self.api_key:
-            print("\n📊 API ACCOUNT BALANCE:")
-            balance = self.get_api_balance()
+            out.append("\n📊 API ACCOUNT BALANCE:")
+            # Independent endpoints: fetch both concurrently over the pooled session
+            balance_future = self._io_pool.submit(self.get_api_balance)
+            info_future = self._io_pool.submit(self.get_account_info)
+            balance = balance_future.result()
+            account_info = info_future.result()
+            
+            if account_info and account_info.get('totalCollateral') is not None:
+                out.append(f"  Total Collateral: ${float(account_info['totalCollateral']):,.2f}")
             if balance:
                 balances = balance.get('balances', [])
                 if balances:
-                    for bal in balances[:10]:  # Show top 10
-                        token = bal.get('token', 'N/A')
-                        holding = float(bal.get('holding', 0))
+                    for bal in itertools.islice(balances, 10):  # Show top 10
+                        holding = bal.get('holding', 0)
+                        if not isinstance(holding, (int, float)):
+                            holding = float(holding)
                         if holding > 0:
-                            print(f"  {token}: {holding:.8f}")
+                            out.append(f"  {bal.get('token', 'N/A')}: {holding:.8f}")
                 else:
-                    print("  No balances found")
+                    out.append("  No balances found")
             else:
-                print("  Unable to fetch API balance")
+                out.append("  Unable to fetch API balance")
         
         # Transaction Summary
-        print("\n📈 TRANSACTION SUMMARY:")
-        summary = self.get_transaction_summary()
+        out.append("\n📈 TRANSACTION SUMMARY:")
+        summary = summary_future.result()
         
-        print(f"  Total Trades: {summary.get('total_trades', 0)}")
-        print(f"  Buy Orders: {summary.get('buy_count', 0)} (Quantity: {summary.get('buy_quantity', 0):.6f})")
-        print(f"  Sell Orders: {summary.get('sell_count', 0)} (Quantity: {summary.get('sell_quantity', 0):.6f})")
-        print(f"  Net P&L (Realized): ${summary.get('net_pnl', 0):,.2f}")
+        out.append(f"  Total Trades: {summary.get('total_trades', 0)}")
+        out.append(f"  Buy Orders: {summary.get('buy_count', 0)} (Quantity: {summary.get('buy_quantity', 0):.6f})")
+        out.append(f"  Sell Orders: {summary.get('sell_count', 0)} (Quantity: {summary.get('sell_quantity', 0):.6f})")
+        out.append(f"  Net P&L (Realized): ${summary.get('net_pnl', 0):,.2f}")
         
         # Open Positions
-        print("\n💼 OPEN POSITIONS:")
-        positions = self.get_open_positions()
+        out.append("\n💼 OPEN POSITIONS:")
+        positions = self._get_positions_with_pnl(current_prices)
         if positions:
             for pos in positions:
-                print(f"  {pos['symbol']}: {pos['quantity']:.6f} @ ${pos['avg_entry_price']:,.2f}")
+                out.append(f"  {pos['symbol']}: {pos['quantity']:.6f} @ ${pos['avg_entry_price']:,.2f}")
                 
-                # Calculate unrealized P&L if current price provided
-                if current_prices and pos['symbol'] in current_prices:
-                    current_price = current_prices[pos['symbol']]
-                    unrealized = (current_price - pos['avg_entry_price']) * pos['quantity']
-                    pnl_pct = ((current_price - pos['avg_entry_price']) / pos['avg_entry_price']) * 100
-                    print(f"    Current: ${current_price:,.2f} | Unrealized P&L: ${unrealized:,.2f} ({pnl_pct:+.2f}%)")
+                # Unrealized P&L is filled in when a current price was provided
+                if pos['current_price'] is not None:
+                    out.append(f"    Current: ${pos['current_price']:,.2f} | Unrealized P&L: ${pos['unrealized_pnl']:,.2f} "
+                               f"({pos['pnl_pct'] or 0.0:+.2f}%)")
         else:
-            print("  No open positions")
+            out.append("  No open positions")
         
         # Recent Trades
-        print("\n📋 RECENT TRADES (Last 10):")
+        out.append("\n📋 RECENT TRADES (Last 10):")
         recent = summary.get('recent_trades', [])
         if recent:
-            print(f"  {'Date':<20} {'Symbol':<15} {'Type':<6} {'Qty':<12} {'Price':<12} {'Code':<5}")
-            print("  " + "-"*75)
-            for trade in recent:
-                # Handle datetime object from database
-                if isinstance(trade[2], datetime):
-                    trade_dt = trade[2].strftime('%Y-%m-%d %H:%M:%S')
-                elif isinstance(trade[2], (int, float)):
-                    trade_dt = datetime.fromtimestamp(trade[2], timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    trade_dt = str(trade[2])
+            out.append(f"  {'Date':<20} {'Symbol':<15} {'Type':<6} {'Qty':<12} {'Price':<12} {'Code':<5}")
+            out.append("  " + "-"*75)
+            for symbol, trade_datetime, trade_type, quantity, price, _proceeds, code in recent:
+                # Both schemas store the trade time as TIMESTAMP, so DuckDB returns datetime
+                trade_dt = trade_datetime.strftime('%Y-%m-%d %H:%M:%S') if trade_datetime else "N/A"
                 
-                symbol = trade[1]
-                trade_type = trade[5]
-                quantity = trade[6]
-                price = trade[7]
-                code = trade[12]
-                print(f"  {trade_dt:<20} {symbol:<15} {trade_type:<6} {quantity:>10.6f} ${price:>10.2f} {code:<5}")
+                out.append(_RECENT_TRADE_ROW_FMT.format(
+                    dt=trade_dt, sym=symbol, tp=trade_type, qty=quantity, px=price, code=code
+                ))
         else:
-            print("  No recent trades")
+            out.append("  No recent trades")
+        
+        out.append("\n" + "="*80 + "\n")
         
-        print("\n" + "="*80 + "\n")
+        # One write for the whole report instead of a syscall per line
+        sys.stdout.write("\n".join(out) + "\n")
+    
+    def reconnect(self):
+        """Replace the database cursors and forget cached schema and statements."""
+        self._close_cursors()
+        if self._conn is not None:
+            _release_conn(self._conn)
+            self._conn = None
+        self._is_new_schema = None
+        self._has_positions_agg = None
     
     def close(self):
-        """Close database connection."""
-        if hasattr(self, 'db_conn'):
-            self.db_conn.close()
-            self.logger.info("Database connection closed")
+        """Close this account's database cursors and HTTP resources, and release the shared connection."""
+        if hasattr(self, '_io_pool'):
+            self._io_pool.shutdown(wait=False)
+        if hasattr(self, '_session'):
+            self._session.close()
+        if hasattr(self, '_cursors'):
+            self._close_cursors()
+            self.logger.info("Database cursors closed")
+        if getattr(self, '_conn', None) is not None:
+            _release_conn(self._conn)
+            self._conn = None
 
 
 def main():
@@ -630,27 +1047,14 @@ def main():
             trade_mode = sys.argv[1]
     
     try:
-        account = Account(trade_mode=trade_mode)
-        
-        # Optionally fetch current price for unrealized P&L
-        current_prices = {}
-        try:
-            response = requests.get(
-                'https://api.woox.io/v3/public/marketTrades',
-                params={'symbol': 'SPOT_BTC_USDT', 'limit': 1},
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    trades = data.get('data', {}).get('rows', [])
-                    if trades:
-                        current_prices['SPOT_BTC_USDT'] = float(trades[0].get('price', 0))
-        except Exception as e:
-            logging.warning("Could not fetch current price: %s", str(e))
-        
-        account.display_account_summary(current_prices)
-        account.close()
+        # Stand-alone reader: read-only so it can run alongside other readers,
+        # and closed right after the summary so a writer isn't locked out
+        with Account(trade_mode=trade_mode, read_only=True) as account:
+            # Optionally fetch current price for unrealized P&L (before the
+            # database is opened)
+            current_prices = account.fetch_mark_prices(['SPOT_BTC_USDT'])
+            
+            account.display_account_summary(current_prices)
         
     except Exception as e:
         logging.error("Error: %s", str(e))
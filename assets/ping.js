@@ -0,0 +1,20 @@
+var serverDownAlertShown = false;
+// One long-lived stream per tab; the browser reconnects on its own after an error
+var pingStream = new EventSource('/ping-stream');
+pingStream.onopen = function() {
+    if (serverDownAlertShown) {
+        // Server came back
+        serverDownAlertShown = false;
+        document.body.style.opacity = "1";
+        document.body.style.pointerEvents = "auto";
+        console.log("Server connection restored");
+    }
+};
+pingStream.onerror = function() {
+    if (!serverDownAlertShown) {
+        alert('⚠️ CRITICAL: Connection to server lost! The bot process has stopped.');
+        serverDownAlertShown = true;
+        document.body.style.opacity = "0.5";
+        document.body.style.pointerEvents = "none";
+    }
+};
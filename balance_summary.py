@@ -7,12 +7,20 @@ Displays comprehensive account balance, positions, and P&L information
 import sys
 import argparse
 from datetime import datetime, timezone
-from account import Account
+from account import Account, parse_json
 import requests
-from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from config_loader import CONFIG
 
 
+# Keep-alive session for public price requests; the pool is sized for the
+# concurrent lookups in get_current_prices
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
 def get_current_price(symbol: str) -> Optional[float]:
     """
     Fetch current market price for a symbol.
@@ -25,12 +33,12 @@ def get_current_price(symbol: str) -> Optional[float]:
     """
     try:
         base_url = CONFIG.get('BASE_URL', 'https://api.woox.io')
-        response = requests.get(
+        response = _SESSION.get(
             f"{base_url}/v3/public/orderbook",
             params={"symbol": symbol},
             timeout=10
         )
-        data = response.json()
+        data = parse_json(response.content)
         
         if data.get('success'):
             orderbook = data.get('data', {})
@@ -47,6 +55,25 @@ def get_current_price(symbol: str) -> Optional[float]:
         return None
 
 
+def get_current_prices(symbols: List[str]) -> Dict[str, Optional[float]]:
+    """
+    Fetch current market prices for several symbols concurrently.
+    
+    Args:
+        symbols: Trading symbols (duplicates are fetched once)
+        
+    Returns:
+        Dictionary mapping each symbol to its price, or None if unavailable
+    """
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return {}
+    
+    # Requests are independent, so total latency is the slowest one, not the sum
+    with ThreadPoolExecutor(max_workers=min(8, len(unique_symbols))) as pool:
+        return dict(zip(unique_symbols, pool.map(get_current_price, unique_symbols)))
+
+
 def format_currency(value: float) -> str:
     """Format currency value with commas and 2 decimal places."""
     return f"${value:,.2f}" if value >= 0 else f"-${abs(value):,.2f}"
@@ -62,32 +89,38 @@ def format_quantity(value: float) -> str:
         return f"{value:.2f}"
 
 
-def print_separator(char: str = "=", length: int = 70):
-    """Print a separator line."""
-    print(char * length)
+def separator(char: str = "=", length: int = 70) -> str:
+    """Build a separator line."""
+    return char * length
+
+
+def write_lines(lines: List[str]):
+    """Write a block of report lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_api_balance(account: Account):
     """Display account balance from API."""
-    print("\n📊 API ACCOUNT BALANCE")
-    print_separator()
+    lines = ["\n📊 API ACCOUNT BALANCE", separator()]
     
     api_balance = account.get_api_balance()
     
     if not api_balance:
-        print("⚠️  Unable to fetch API balance. Check API credentials.")
+        lines.append("⚠️  Unable to fetch API balance. Check API credentials.")
+        write_lines(lines)
         return
     
     holding = api_balance.get('holding', [])
     
     if not holding:
-        print("No balances found.")
+        lines.append("No balances found.")
+        write_lines(lines)
         return
     
     total_value = 0.0
     
-    print(f"{'Token':<12} {'Available':<18} {'Frozen':<18} {'Total':<18}")
-    print_separator("-")
+    lines.append(f"{'Token':<12} {'Available':<18} {'Frozen':<18} {'Total':<18}")
+    lines.append(separator("-"))
     
     for balance in holding:
         token = balance.get('token', '')
@@ -96,40 +129,41 @@ def display_api_balance(account: Account):
         total = available + frozen
         
         if total > 0:  # Only show non-zero balances
-            print(f"{token:<12} {available:<18.8f} {frozen:<18.8f} {total:<18.8f}")
+            lines.append(f"{token:<12} {available:<18.8f} {frozen:<18.8f} {total:<18.8f}")
             
             # Approximate USD value for USDT
             if token == 'USDT':
                 total_value += total
     
-    print_separator("-")
+    lines.append(separator("-"))
     if total_value > 0:
-        print(f"Estimated Total Value: {format_currency(total_value)}")
+        lines.append(f"Estimated Total Value: {format_currency(total_value)}")
+    
+    write_lines(lines)
 
 
-def display_open_positions(account: Account):
+def display_open_positions(positions: List[Dict[str, Any]]):
     """Display open positions with unrealized P&L."""
-    print("\n📈 OPEN POSITIONS")
-    print_separator()
-    
-    positions = account.get_open_positions()
+    lines = ["\n📈 OPEN POSITIONS", separator()]
     
     if not positions:
-        print("No open positions.")
+        lines.append("No open positions.")
+        write_lines(lines)
         return
     
-    print(f"{'Symbol':<20} {'Quantity':<15} {'Avg Entry':<15} {'Current':<15} {'Unrealized P&L':<20}")
-    print_separator("-")
+    lines.append(f"{'Symbol':<20} {'Quantity':<15} {'Avg Entry':<15} {'Current':<15} {'Unrealized P&L':<20}")
+    lines.append(separator("-"))
     
     total_unrealized_pnl = 0.0
     
+    # Get current prices for all positions at once
+    current_prices = get_current_prices([pos['symbol'] for pos in positions])
+    
     for pos in positions:
         symbol = pos['symbol']
         quantity = pos['quantity']
         avg_entry = pos['avg_entry_price']
-        
-        # Get current price
-        current_price = get_current_price(symbol)
+        current_price = current_prices.get(symbol)
         
         if current_price:
             unrealized_pnl = (current_price - avg_entry) * quantity
@@ -138,93 +172,74 @@ def display_open_positions(account: Account):
             pnl_str = format_currency(unrealized_pnl)
             pnl_color = "🟢" if unrealized_pnl >= 0 else "🔴"
             
-            print(f"{symbol:<20} {format_quantity(quantity):<15} {avg_entry:<15.2f} "
-                  f"{current_price:<15.2f} {pnl_color} {pnl_str:<18}")
+            lines.append(f"{symbol:<20} {format_quantity(quantity):<15} {avg_entry:<15.2f} "
+                         f"{current_price:<15.2f} {pnl_color} {pnl_str:<18}")
         else:
-            print(f"{symbol:<20} {format_quantity(quantity):<15} {avg_entry:<15.2f} "
-                  f"{'N/A':<15} {'N/A':<20}")
+            lines.append(f"{symbol:<20} {format_quantity(quantity):<15} {avg_entry:<15.2f} "
+                         f"{'N/A':<15} {'N/A':<20}")
     
-    print_separator("-")
+    lines.append(separator("-"))
     if total_unrealized_pnl != 0:
         pnl_indicator = "🟢" if total_unrealized_pnl >= 0 else "🔴"
-        print(f"Total Unrealized P&L: {pnl_indicator} {format_currency(total_unrealized_pnl)}")
+        lines.append(f"Total Unrealized P&L: {pnl_indicator} {format_currency(total_unrealized_pnl)}")
+    
+    write_lines(lines)
 
 
-def display_transaction_summary(account: Account):
+def display_transaction_summary(summary: Dict[str, Any]):
     """Display transaction summary and realized P&L."""
-    print("\n💰 TRANSACTION SUMMARY")
-    print_separator()
-    
-    summary = account.get_transaction_summary()
+    lines = ["\n💰 TRANSACTION SUMMARY", separator()]
     
     if not summary:
-        print("No transaction data available.")
+        lines.append("No transaction data available.")
+        write_lines(lines)
         return
     
-    print(f"Total Trades:        {summary.get('total_trades', 0)}")
-    print(f"Buy Orders:          {summary.get('buy_count', 0)}")
-    print(f"Sell Orders:         {summary.get('sell_count', 0)}")
-    print()
-    print(f"Total Buy Volume:    {format_quantity(summary.get('buy_quantity', 0.0))}")
-    print(f"Total Buy Cost:      {format_currency(abs(summary.get('buy_proceeds', 0.0)))}")
-    print()
-    print(f"Total Sell Volume:   {format_quantity(summary.get('sell_quantity', 0.0))}")
-    print(f"Total Sell Revenue:  {format_currency(summary.get('sell_proceeds', 0.0))}")
-    print_separator("-")
+    lines.append(f"Total Trades:        {summary.get('total_trades', 0)}")
+    lines.append(f"Buy Orders:          {summary.get('buy_count', 0)}")
+    lines.append(f"Sell Orders:         {summary.get('sell_count', 0)}")
+    lines.append("")
+    lines.append(f"Total Buy Volume:    {format_quantity(summary.get('buy_quantity', 0.0))}")
+    lines.append(f"Total Buy Cost:      {format_currency(abs(summary.get('buy_proceeds', 0.0)))}")
+    lines.append("")
+    lines.append(f"Total Sell Volume:   {format_quantity(summary.get('sell_quantity', 0.0))}")
+    lines.append(f"Total Sell Revenue:  {format_currency(summary.get('sell_proceeds', 0.0))}")
+    lines.append(separator("-"))
     
     net_pnl = summary.get('net_pnl', 0.0)
     pnl_indicator = "🟢" if net_pnl >= 0 else "🔴"
-    print(f"Net Cash Flow:       {pnl_indicator} {format_currency(net_pnl)}")
+    lines.append(f"Net Cash Flow:       {pnl_indicator} {format_currency(net_pnl)}")
+    
+    write_lines(lines)
 
 
-def display_recent_trades(account: Account, limit: int = 10):
+def display_recent_trades(summary: Dict[str, Any], limit: int = 10):
     """Display recent trades."""
-    print(f"\n📋 RECENT TRADES (Last {limit})")
-    print_separator()
+    lines = [f"\n📋 RECENT TRADES (Last {limit})", separator()]
     
-    summary = account.get_transaction_summary()
     recent_trades = summary.get('recent_trades', [])
     
     if not recent_trades:
-        print("No recent trades.")
+        lines.append("No recent trades.")
+        write_lines(lines)
         return
     
-    print(f"{'Date/Time (UTC)':<20} {'Symbol':<20} {'Type':<6} {'Qty':<12} {'Price':<12} {'Value':<15}")
-    print_separator("-")
+    lines.append(f"{'Date/Time (UTC)':<20} {'Symbol':<20} {'Type':<6} {'Qty':<12} {'Price':<12} {'Value':<15}")
+    lines.append(separator("-"))
     
     for trade in recent_trades[:limit]:
-        # Schema: acct_id, symbol, trade_datetime, exchange, signal, trade_type, quantity, price, proceeds, commission, fee, order_type, code
-        acct_id = trade[0]
-        symbol = trade[1]
-        trade_datetime = trade[2]
-        exchange = trade[3]
-        signal = trade[4]
-        trade_type = trade[5]
-        quantity = trade[6]
-        price = trade[7]
-        proceeds = trade[8]
+        # Columns: see account.RECENT_TRADE_COLUMNS
+        symbol, trade_datetime, trade_type, quantity, price, proceeds, _code = trade
         
-        # Format datetime
-        dt = None
-        if isinstance(trade_datetime, str):
-            try:
-                dt = datetime.fromisoformat(trade_datetime)
-            except ValueError:
-                pass
-        elif isinstance(trade_datetime, datetime):
-            dt = trade_datetime
-            
-        if dt:
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            dt_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            dt_str = str(trade_datetime)[:19] if trade_datetime else "N/A"
+        # trade_datetime is a TIMESTAMP column (UTC), returned as datetime
+        dt_str = trade_datetime.strftime("%Y-%m-%d %H:%M:%S") if trade_datetime else "N/A"
         
         type_indicator = "🟢" if trade_type == "BUY" else "🔴"
         
-        print(f"{dt_str:<20} {symbol:<20} {type_indicator} {trade_type:<4} "
-              f"{format_quantity(abs(quantity)):<12} {price:<12.2f} {format_currency(proceeds):<15}")
+        lines.append(f"{dt_str:<20} {symbol:<20} {type_indicator} {trade_type:<4} "
+                     f"{format_quantity(abs(quantity)):<12} {price:<12.2f} {format_currency(proceeds):<15}")
+    
+    write_lines(lines)
 
 
 def main():
@@ -240,36 +255,43 @@ def main():
     args = parser.parse_args()
     
     # Print header
-    print("\n" + "="*70)
-    print("🏦  WOOX ACCOUNT BALANCE SUMMARY")
-    print("="*70)
-    print(f"Mode: {args.mode.upper()}")
-    print(f"Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    print("="*70)
+    write_lines([
+        "\n" + "="*70,
+        "🏦  WOOX ACCOUNT BALANCE SUMMARY",
+        "="*70,
+        f"Mode: {args.mode.upper()}",
+        f"Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
+        "="*70,
+    ])
     
     # Initialize account
     try:
-        account = Account(trade_mode=args.mode)
+        account = Account(trade_mode=args.mode, read_only=True)
     except Exception as e:
         print(f"\n❌ Error initializing account: {e}")
         sys.exit(1)
     
-    # Display API balance
-    if not args.no_api:
-        display_api_balance(account)
+    with account:
+        # Display API balance (the database isn't opened yet)
+        if not args.no_api:
+            display_api_balance(account)
+        
+        # Read everything from the database up front and close the account,
+        # so its file lock doesn't block the trading process while prices load
+        positions = account.get_open_positions()
+        # Transaction summary and recent trades come from one summary query
+        summary = account.get_transaction_summary()
     
     # Display open positions
-    display_open_positions(account)
+    display_open_positions(positions)
     
     # Display transaction summary
-    display_transaction_summary(account)
+    display_transaction_summary(summary)
     
     # Display recent trades
-    display_recent_trades(account, limit=args.trades)
+    display_recent_trades(summary, limit=args.trades)
     
-    print("\n" + "="*70)
-    print("✅ Balance summary complete")
-    print("="*70 + "\n")
+    write_lines(["\n" + "="*70, "✅ Balance summary complete", "="*70 + "\n"])
 
 
 if __name__ == "__main__":
@@ -1,36 +1,56 @@
 import requests
 import json
+import os
+import time
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib parser
+    orjson = None
 
 BASE_URL = "https://api.woox.io"
 SYMBOL = "PERP_BTC_USDT"
 
+# The full /v1/public/info catalog is cached on disk; symbol rules change rarely
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.woox_info_cache.json')
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def load_info_rows():
+    """Return the /v1/public/info rows, from the disk cache when it is fresh."""
+    try:
+        if time.time() - os.path.getmtime(CACHE_FILE) < CACHE_TTL_SECONDS:
+            with open(CACHE_FILE, 'rb') as f:
+                return orjson.loads(f.read()) if orjson else json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable cache: fetch below
+        pass
+
+    url = f"{BASE_URL}/v1/public/info"
+    print(f"Fetching info from: {url}")
+    response = requests.get(url, timeout=10)
+    if response.status_code != 200:
+        print(f"Error: {response.status_code} - {response.text}")
+        return None
+
+    data = orjson.loads(response.content) if orjson else response.json()
+    rows = data.get('rows', [])
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(rows, f)
+    return rows
+
 def get_symbol_info():
     try:
-        # Try v1 public info
-        url = f"{BASE_URL}/v1/public/info/{SYMBOL}"
-        print(f"Fetching info from: {url}")
-        response = requests.get(url)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(json.dumps(data, indent=2))
-        else:
-            print(f"Error: {response.status_code} - {response.text}")
-            
-            # Try generic info endpoint if specific one fails
-            url = f"{BASE_URL}/v1/public/info"
-            print(f"Fetching info from: {url}")
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                # Filter for our symbol
-                rows = data.get('rows', [])
-                for row in rows:
-                    if row.get('symbol') == SYMBOL:
-                        print(json.dumps(row, indent=2))
-                        return
-                print(f"Symbol {SYMBOL} not found in generic info.")
-            
+        rows = load_info_rows()
+        if rows is None:
+            return
+
+        # Filter for our symbol
+        row = next((row for row in rows if row.get('symbol') == SYMBOL), None)
+        if row is None:
+            print(f"Symbol {SYMBOL} not found in generic info.")
+            return
+        print(json.dumps(row, indent=2))
+
     except Exception as e:
         print(f"Exception: {e}")
 
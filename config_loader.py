@@ -3,58 +3,76 @@ Configuration loader for WOOX Trading Bot.
 Reads settings from .config file in the project root.
 """
 import os
+import re
+import functools
 from typing import Dict, Any
 
 
+# One "key = value" line; the key may not start with '#', so comments never match
+_LINE_RE = re.compile(r'^\s*+(?!#)([^=]*?)\s*=\s*(.*?)\s*$')
+
+# Plain decimal numbers ("10", "-0.5", ".5"); anything else stays a string
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+
 def load_config(config_path: str = '.config') -> Dict[str, Any]:
     """
     Load configuration from .config file.
     
+    The parsed file is cached and re-read only when its modification time
+    changes, so callers can keep calling this to pick up edits cheaply.
+    
     Args:
         config_path: Path to the configuration file (default: .config)
         
     Returns:
         Dictionary containing configuration key-value pairs
     """
-    config = {}
-    
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     full_path = os.path.join(script_dir, config_path)
     
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Configuration file not found: {full_path}")
+    try:
+        mtime_ns = os.stat(full_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {full_path}") from None
+    
+    # Copy so callers can modify their result without touching the cache
+    return dict(_parse_config(full_path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(full_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file; cached per (path, modification time).
+    
+    Args:
+        full_path: Absolute path to the configuration file
+        mtime_ns: Modification time of the file, part of the cache key
+        
+    Returns:
+        Dictionary containing configuration key-value pairs
+    """
+    config = {}
     
     with open(full_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse key=value pairs
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                # Convert numeric values (only if purely numeric)
-                try:
-                    # Check if it's a valid number
-                    if value.replace('.', '', 1).replace('-', '', 1).isdigit():
-                        value = float(value) if '.' in value else int(value)
-                except (ValueError, AttributeError):
-                    # Keep as string if conversion fails
-                    pass
-                
-                config[key] = value
+        lines = f.read().splitlines()
+    
+    # Blank lines and comments don't match, so they are skipped here
+    for match in filter(None, map(_LINE_RE.match, lines)):
+        key, value = match.groups()
+        
+        # Remove quotes if present
+        if value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        elif value.startswith("'") and value.endswith("'"):
+            value = value[1:-1]
+        
+        # Convert numeric values (only if purely numeric)
+        if _NUMBER_RE.fullmatch(value):
+            value = float(value) if '.' in value else int(value)
+        
+        config[key] = value
     
     return config
 
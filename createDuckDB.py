@@ -1,80 +1,137 @@
 import duckdb
 from datetime import datetime, timezone
 import argparse
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+# Paper-mode trades table layout, shared with Trade._init_database
+TRADES_SCHEMA = {
+    'acct_id': 'TEXT',
+    'symbol': 'TEXT',
+    'trade_datetime': 'TIMESTAMP',
+    'exchange': 'TEXT',
+    'signal': 'TEXT',
+    'trade_type': 'TEXT',
+    'quantity': 'DOUBLE',
+    'price': 'DOUBLE',
+    'proceeds': 'DOUBLE',
+    'commission': 'DOUBLE',
+    'fee': 'DOUBLE',
+    'order_type': 'TEXT',
+    'code': 'TEXT',
+    'realized_pnl': 'DOUBLE'
+}
+
+# Column list for CREATE TABLE trades (...)
+TRADES_COLUMNS_DDL = ", ".join(f"{col} {dtype}" for col, dtype in TRADES_SCHEMA.items())
+
+# Index on the recent-trades sort key, also created by Trade._init_database
+TRADES_INDEX_DDL = "CREATE INDEX IF NOT EXISTS idx_trades_dt ON trades(trade_datetime)"
+
+# Default value for columns added to an existing table, by type
+_DEFAULT = {'DOUBLE': '0.0', 'TEXT': 'NULL', 'TIMESTAMP': 'NULL'}
+
+# ALTER statement that adds each column to an older trades table
+_ADD_COLUMN_SQL = {
+    col: f"ALTER TABLE trades ADD COLUMN {col} {dtype} DEFAULT {_DEFAULT.get(dtype, 'NULL')}"
+    for col, dtype in TRADES_SCHEMA.items()
+}
+
+# Seed rows for a fresh paper_transaction.db
+_SAMPLE_DATA = [
+    ("USER01", "TESTTICKER1", datetime(2025, 11, 13, 9, 31, 5, tzinfo=timezone.utc), "woox", "SMA1030", "BUY", 10, 335.0000, -3350.00, -1.00, 0.00, "LMT", "O", 0.0),
+    ("USER01", "TESTTICKER2", datetime(2025, 11, 13, 11, 5, 36, tzinfo=timezone.utc), "woox", "SMA1030", "BUY", 10, 333.0000, -3330.00, -1.00, 0.00, "LMT", "O", 0.0),
+    ("USER01", "TESTTICKER1", datetime(2025, 11, 13, 10, 23, 52, tzinfo=timezone.utc), "woox", "SMA1030", "SELL", -10, 337.4100, 3374.10, -1.00, 0.00, "LMT", "C", 24.10)
+]
+
+# One multi-row INSERT, so the statement is parsed and planned once
+_ROW_PLACEHOLDERS = "(" + ", ".join(["?"] * len(TRADES_SCHEMA)) + ")"
+_SAMPLE_INSERT_SQL = "INSERT INTO trades VALUES " + ", ".join([_ROW_PLACEHOLDERS] * len(_SAMPLE_DATA))
+_SAMPLE_PARAMS = [value for row in _SAMPLE_DATA for value in row]
+
+
 def init_db(db_name='paper_transaction.db', reset=False):
-    print(f"Connecting to {db_name}...")
+    logger.info("Connecting to %s...", db_name)
     conn = duckdb.connect(db_name)
     
-    if reset:
-        print("Resetting database...")
-        conn.execute("DROP TABLE IF EXISTS trades")
-    
-    # Define expected schema
-    schema = {
-        'acct_id': 'TEXT',
-        'symbol': 'TEXT',
-        'trade_datetime': 'TIMESTAMP',
-        'exchange': 'TEXT',
-        'signal': 'TEXT',
-        'trade_type': 'TEXT',
-        'quantity': 'DOUBLE',
-        'price': 'DOUBLE',
-        'proceeds': 'DOUBLE',
-        'commission': 'DOUBLE',
-        'fee': 'DOUBLE',
-        'order_type': 'TEXT',
-        'code': 'TEXT',
-        'realized_pnl': 'DOUBLE'
-    }
-    
-    # Check if table exists
-    tables = conn.execute("SHOW TABLES").fetchall()
-    # tables is a list of tuples, e.g. [('trades',)]
-    table_names = [t[0] for t in tables]
-    
-    if 'trades' not in table_names:
-        print("Creating 'trades' table...")
-        columns = ", ".join([f"{col} {dtype}" for col, dtype in schema.items()])
-        conn.execute(f"CREATE TABLE trades ({columns})")
-    else:
-        print("'trades' table exists. Checking schema...")
-        # Get existing columns
-        existing_cols = conn.execute("DESCRIBE trades").fetchall()
-        existing_col_names = [col[0] for col in existing_cols]
+    # Schema changes, seed rows and derived tables commit as one transaction
+    conn.begin()
+    try:
+        if reset:
+            logger.info("Resetting database...")
+            conn.execute("DROP TABLE IF EXISTS trades")
+        
+        # No-op when the table is already there
+        conn.execute(f"CREATE TABLE IF NOT EXISTS trades ({TRADES_COLUMNS_DDL})")
+        
+        # Bring older tables up to the current schema
+        existing_cols = conn.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = 'trades'"
+        ).fetchall()
+        existing_col_names = {col[0] for col in existing_cols}
         
         # Add missing columns
-        for col, dtype in schema.items():
+        additions = []
+        for col, dtype in TRADES_SCHEMA.items():
             if col not in existing_col_names:
-                print(f"Adding missing column: {col} ({dtype})")
-                # Default value for new columns
-                default_val = "0.0" if dtype == 'DOUBLE' else "NULL"
-                conn.execute(f"ALTER TABLE trades ADD COLUMN {col} {dtype} DEFAULT {default_val}")
-    
-    # Check if empty
-    count = conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
-    print(f"Current record count: {count}")
-    
-    if count == 0 and db_name == 'paper_transaction.db':
-        print("Inserting sample data...")
-        sample_data = [
-            ("USER01", "TESTTICKER1", datetime(2025, 11, 13, 9, 31, 5, tzinfo=timezone.utc), "woox", "SMA1030", "BUY", 10, 335.0000, -3350.00, -1.00, 0.00, "LMT", "O", 0.0),
-            ("USER01", "TESTTICKER2", datetime(2025, 11, 13, 11, 5, 36, tzinfo=timezone.utc), "woox", "SMA1030", "BUY", 10, 333.0000, -3330.00, -1.00, 0.00, "LMT", "O", 0.0),
-            ("USER01", "TESTTICKER1", datetime(2025, 11, 13, 10, 23, 52, tzinfo=timezone.utc), "woox", "SMA1030", "SELL", -10, 337.4100, 3374.10, -1.00, 0.00, "LMT", "C", 24.10)
-        ]
+                logger.info("Adding missing column: %s (%s)", col, dtype)
+                additions.append(_ADD_COLUMN_SQL[col])
         
-        placeholders = ", ".join(["?"] * len(schema))
-        conn.executemany(f"INSERT INTO trades VALUES ({placeholders})", sample_data)
-        print("Sample data inserted.")
+        # DuckDB takes one ALTER clause per statement; they commit together below
+        for statement in additions:
+            conn.execute(statement)
+        
+        # Check if empty; stops at the first row instead of counting them all
+        has_rows = conn.execute("SELECT 1 FROM trades LIMIT 1").fetchone() is not None
+        logger.info("Table has existing records" if has_rows else "Table is empty")
+        
+        if not has_rows and db_name == 'paper_transaction.db':
+            logger.info("Inserting sample data...")
+            conn.execute(_SAMPLE_INSERT_SQL, _SAMPLE_PARAMS)
+            logger.info("Sample data inserted.")
+        
+        # Index the recent-trades sort key
+        conn.execute(TRADES_INDEX_DDL)
+        # Per-symbol trade lookups
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol_dt ON trades(symbol, trade_datetime)")
+        # Per-symbol position totals, rebuilt here and kept current by
+        # Trade._record_transaction so Account can read positions without a scan
+        conn.execute("""
+        CREATE OR REPLACE TABLE positions_agg (
+            symbol TEXT PRIMARY KEY,
+            net_quantity DOUBLE,
+            price_sum DOUBLE,
+            trade_count BIGINT
+        )
+        """)
+        conn.execute("""
+        INSERT INTO positions_agg
+        SELECT symbol, SUM(quantity), SUM(price), COUNT(*)
+        FROM trades
+        WHERE symbol IS NOT NULL
+        GROUP BY symbol
+        """)
+        
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        conn.close()
+        raise
+    
+    # Flush the WAL so readers start from a compacted file with fresh zonemaps
+    conn.execute("CHECKPOINT")
         
     conn.close()
-    print("Database initialization complete.")
+    logger.info("Database initialization complete.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Initialize or update DuckDB database.')
     parser.add_argument('--db', type=str, default='paper_transaction.db', help='Database file name')
     parser.add_argument('--reset', action='store_true', help='Drop existing table and recreate')
+    parser.add_argument('--quiet', action='store_true', help='Only report warnings and errors')
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format='%(message)s')
     init_db(args.db, args.reset)
@@ -5,6 +5,7 @@ Real-time monitoring, control, and analysis
 import dash
 from dash import dcc, html, Input, Output, State, callback_context, ALL, MATCH
 import plotly.graph_objects as go
+from flask import Response
 from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime, timedelta, timezone
@@ -14,8 +15,9 @@ from trade import Trade
 from account import Account
 import config_loader
 import logging
-from collections import deque
 import duckdb
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import psutil
 import os
 
@@ -48,357 +50,130 @@ performance_metrics = {
     'unrealized_pnl': 0.0
 }
 
-# Store recent data for charts
+class RingBuffer:
+    """Fixed-capacity circular buffer backed by a preallocated NumPy array.
+
+    Appends overwrite the oldest value once the buffer is full, like a
+    deque with maxlen, without allocating per element.
+    """
+    __slots__ = ('data', 'index', 'count')
+
+    def __init__(self, capacity, dtype=np.float64):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.index = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % len(self.data)
+        if self.count < len(self.data):
+            self.count += 1
+
+    def view(self):
+        """Return the stored values, oldest first.
+
+        Returns:
+            np.ndarray: A view of the array until the buffer wraps, then an
+            ordered copy.
+        """
+        if self.count < len(self.data):
+            return self.data[:self.count]
+        return np.concatenate((self.data[self.index:], self.data[:self.index]))
+
+
+def rolling_sma(values, period):
+    """Simple moving average over a trailing window.
+
+    Args:
+        values: Sequence of prices, oldest first.
+        period: Window length.
+
+    Returns:
+        np.ndarray: One value per input; NaN until a full window is available.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    sma = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        sma[period - 1:] = sliding_window_view(values, period).sum(axis=1) / period
+    return sma
+
+
+def rolling_rsi(prices, period):
+    """RSI from simple averages of the gains and losses over the last `period` price changes.
+
+    Simple averages rather than Wilder's smoothing, which is close enough
+    for the chart.
+
+    Args:
+        prices: Sequence of prices, oldest first; needs at least period + 1 values.
+        period: Number of price changes per window.
+
+    Returns:
+        np.ndarray: One value per price; NaN for the first `period` points.
+        A window with no losses reads 100.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    rsi = np.full(len(prices), np.nan)
+    deltas = np.diff(prices)
+    avg_gain = sliding_window_view(np.maximum(deltas, 0), period).sum(axis=1) / period
+    avg_loss = sliding_window_view(np.maximum(-deltas, 0), period).sum(axis=1) / period
+    rs = np.divide(avg_gain, avg_loss, out=np.zeros_like(avg_gain), where=avg_loss != 0)
+    rsi[period:] = np.where(avg_loss != 0, 100 - (100 / (1 + rs)), 100.0)
+    return rsi
+
+
+# Store recent data for charts (timestamps are naive UTC). Plot-only series
+# are float32, which is plenty for drawing and halves what goes to the browser;
+# prices stay float64 because the session price change is computed from them.
+# The P&L, RSI and MA charts derive their series on each refresh instead.
 chart_data = {
-    'timestamps': deque(maxlen=500),
-    'prices': deque(maxlen=500),
-    'volumes': deque(maxlen=500),
-    'pnl': deque(maxlen=500),
-    'bid_depth': deque(maxlen=500),
-    'ask_depth': deque(maxlen=500),
-    'spread': deque(maxlen=500),
-    'rsi': deque(maxlen=500),
-    'ma_short': deque(maxlen=500),
-    'ma_long': deque(maxlen=500)
+    'timestamps': RingBuffer(500, 'datetime64[ms]'),
+    'prices': RingBuffer(500),
+    'volumes': RingBuffer(500, np.float32),
+    'bid_depth': RingBuffer(500, np.float32),
+    'ask_depth': RingBuffer(500, np.float32),
+    'spread': RingBuffer(500, np.float32)
 }
 
-# Custom CSS
-app.index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>{%title%}</title>
-        {%favicon%}
-        {%css%}
-        <script>
-            var serverDownAlertShown = false;
-            setInterval(function() {
-                fetch('/', { method: 'HEAD' })
-                    .then(function(response) {
-                        if (response.ok) {
-                            if (serverDownAlertShown) {
-                                // Server came back
-                                serverDownAlertShown = false;
-                                document.body.style.opacity = "1";
-                                document.body.style.pointerEvents = "auto";
-                                console.log("Server connection restored");
-                            }
-                        }
-                    })
-                    .catch(function(error) {
-                        if (!serverDownAlertShown) {
-                            alert('⚠️ CRITICAL: Connection to server lost! The bot process has stopped.');
-                            serverDownAlertShown = true;
-                            document.body.style.opacity = "0.5";
-                            document.body.style.pointerEvents = "none";
-                        }
-                    });
-            }, 2000);
-        </script>
-        <style>
-            @keyframes blink {
-                0% { opacity: 1; }
-                50% { opacity: 0; }
-                100% { opacity: 1; }
-            }
-            .blink-text {
-                animation: blink 1s linear infinite;
-                color: #2196F3;
-                font-weight: bold;
-            }
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background-color: #0e1117;
-                color: #e0e0e0;
-                margin: 0;
-                padding: 0;
-            }
-            .container {
-                max-width: 1800px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-            .header {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 20px;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            }
-            .metric-card {
-                background-color: #1e2130;
-                border-radius: 8px;
-                padding: 15px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-                border-left: 4px solid #667eea;
-            }
-            .metric-value {
-                font-size: 24px;
-                font-weight: bold;
-                color: #ffffff;
-                margin: 5px 0;
-            }
-            .metric-label {
-                font-size: 14px;
-                color: #b0b0b0;
-                text-transform: uppercase;
-                font-weight: 500;
-            }
-            .metric-change {
-                font-size: 14px;
-                margin-top: 5px;
-            }
-            .positive { color: #00c853; }
-            .negative { color: #ff1744; }
-            .neutral { color: #ffd600; }
-            .control-button {
-                padding: 12px 24px;
-                margin: 5px;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-                font-weight: bold;
-                cursor: pointer;
-                transition: all 0.3s;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            }
-            .start-btn {
-                background: linear-gradient(135deg, #00c853 0%, #00e676 100%);
-                color: white;
-            }
-            .stop-btn {
-                background: linear-gradient(135deg, #ff1744 0%, #ff5252 100%);
-                color: white;
-            }
-            .close-btn {
-                background: linear-gradient(135deg, #ffd600 0%, #ffea00 100%);
-                color: #1a1a1a;
-                font-weight: bold;
-            }
-            .print-btn {
-                background: linear-gradient(135deg, #2196F3 0%, #42A5F5 100%);
-                color: white;
-            }
-            .control-button:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-            }
-            @media print {
-                body {
-                    background-color: white !important;
-                    color: black !important;
-                }
-                .no-print {
-                    display: none !important;
-                }
-                .print-only {
-                    display: block !important;
-                }
-                .header {
-                    background: white !important;
-                    color: black !important;
-                    border: 2px solid #667eea;
-                }
-                .metric-card {
-                    background-color: white !important;
-                    color: black !important;
-                    border: 1px solid #ddd;
-                    page-break-inside: avoid;
-                }
-                .metric-value {
-                    color: black !important;
-                }
-                .metric-label {
-                    color: #555 !important;
-                }
-                h1, h2, h3, h4, h5, h6 {
-                    color: black !important;
-                }
-                table {
-                    border-collapse: collapse;
-                    width: 100%;
-                }
-                table td, table th {
-                    border: 1px solid #ddd;
-                    padding: 8px;
-                    color: black !important;
-                }
-                table th {
-                    background-color: #f0f0f0 !important;
-                }
-            }
-            .status-indicator {
-                display: inline-block;
-                width: 12px;
-                height: 12px;
-                border-radius: 50%;
-                margin-right: 8px;
-            }
-            .status-running { background-color: #00c853; animation: pulse 2s infinite; }
-            .status-stopped { background-color: #ff1744; }
-            @keyframes pulse {
-                0%, 100% { opacity: 1; }
-                50% { opacity: 0.5; }
-            }
-            .print-only {
-                display: none;
-            }
-            /* Modal Styles */
-            .modal {
-                display: none;
-                position: fixed;
-                z-index: 1000;
-                left: 0;
-                top: 0;
-                width: 100%;
-                height: 100%;
-                overflow: auto;
-                background-color: rgba(0,0,0,0.5);
-            }
-            .modal-content {
-                background-color: #1e2130;
-                margin: 5% auto;
-                padding: 20px;
-                border: 1px solid #667eea;
-                border-radius: 10px;
-                width: 80%;
-                max-width: 1200px;
-                color: white;
-                box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-                font-size: 11px;
-            }
-            .close {
-                color: #aaa;
-                float: right;
-                font-size: 28px;
-                font-weight: bold;
-            }
-            .close:hover,
-            .close:focus {
-                color: white;
-                text-decoration: none;
-                cursor: pointer;
-            }
-            .form-group {
-                margin-bottom: 15px;
-            }
-            .form-label {
-                display: block;
-                margin-bottom: 5px;
-                color: #a0a0a0;
-                font-size: 11px;
-            }
-            .form-input {
-                width: 100%;
-                padding: 8px;
-                border-radius: 4px;
-                border: 1px solid #444;
-                background-color: #2d3142;
-                color: white;
-                font-size: 11px;
-            }
-            /* Dropdown Dark Mode */
-            .Select-control {
-                background-color: #2d3142 !important;
-                border: 1px solid #444 !important;
-                color: white !important;
-                font-size: 11px !important;
-            }
-            .Select-value-label {
-                color: white !important;
-            }
-            .Select-menu-outer {
-                background-color: #2d3142 !important;
-                border: 1px solid #444 !important;
-            }
-            .Select-option {
-                background-color: #2d3142 !important;
-                color: white !important;
-            }
-            .Select-option:hover {
-                background-color: #667eea !important;
-            }
-            .Select-placeholder {
-                color: #a0a0a0 !important;
-            }
-            .Select-arrow-zone {
-                color: white !important;
-            }
-            .Select-clear-zone {
-                color: white !important;
-            }
-            .chart-card {
-                background-color: #1e2130;
-                border-radius: 10px;
-                padding: 20px;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            /* Neon Mode Indicators */
-            @keyframes neon-green {
-                0% { box-shadow: 0 0 5px #00ff00, 0 0 10px #00ff00; opacity: 1; }
-                50% { box-shadow: 0 0 2px #00ff00, 0 0 5px #00ff00; opacity: 0.7; }
-                100% { box-shadow: 0 0 5px #00ff00, 0 0 10px #00ff00; opacity: 1; }
-            }
-            @keyframes neon-orange {
-                0% { box-shadow: 0 0 5px #ff9900, 0 0 10px #ff9900; opacity: 1; }
-                50% { box-shadow: 0 0 2px #ff9900, 0 0 5px #ff9900; opacity: 0.7; }
-                100% { box-shadow: 0 0 5px #ff9900, 0 0 10px #ff9900; opacity: 1; }
-            }
-            .mode-indicator {
-                padding: 5px 15px;
-                border-radius: 15px;
-                font-weight: bold;
-                text-transform: uppercase;
-                font-size: 12px;
-                letter-spacing: 1px;
-                transition: all 0.5s ease;
-                display: inline-block;
-            }
-            .mode-live {
-                color: #00ff00;
-                border: 1px solid #00ff00;
-                animation: neon-green 2s infinite alternate;
-            }
-            .mode-paper {
-                color: #ff9900;
-                border: 1px solid #ff9900;
-                animation: neon-orange 2s infinite alternate;
-            }
-            /* Robot Animation */
-            @keyframes robot-move {
-                0% { transform: translateY(0) rotate(0deg); }
-                25% { transform: translateY(-2px) rotate(-5deg); }
-                50% { transform: translateY(0) rotate(0deg); }
-                75% { transform: translateY(-2px) rotate(5deg); }
-                100% { transform: translateY(0) rotate(0deg); }
-            }
-            .robot-working {
-                display: inline-block;
-                font-size: 24px;
-                margin-right: 10px;
-                animation: robot-move 1s infinite ease-in-out;
-            }
-            .robot-sleeping {
-                display: inline-block;
-                font-size: 24px;
-                margin-right: 10px;
-                opacity: 0.5;
-                filter: grayscale(100%);
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-    </body>
-</html>
-'''
+# Latest CPU/memory usage in percent, shared by every open dashboard tab
+system_usage = {'cpu': None, 'memory': None}
+
+
+def sample_system_usage():
+    """Sample CPU and memory usage once a second into system_usage."""
+    while True:
+        try:
+            # Blocks for the one-second measurement window
+            system_usage['cpu'] = psutil.cpu_percent(interval=1.0)
+            system_usage['memory'] = psutil.virtual_memory().percent
+        except Exception as e:
+            logger.debug(f"System usage sample failed: {e}")
+            time.sleep(1.0)
+
+
+threading.Thread(target=sample_system_usage, daemon=True).start()
+
+# Styles (assets/dashboard.css) and the server keepalive script (assets/ping.js)
+# are served from the assets folder. Their URLs carry the file mtime, so the
+# browser can keep them cached until they change.
+app.server.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+
+# Seconds between keepalive comments on the ping stream
+PING_STREAM_INTERVAL = 15
+
+
+@app.server.route('/ping-stream')
+def ping_stream():
+    """Hold a server-sent event stream open so the page notices when the server stops."""
+    def keepalive():
+        while True:
+            yield ': keepalive\n\n'
+            time.sleep(PING_STREAM_INTERVAL)
+    return Response(keepalive(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
 
 # Layout
 app.layout = html.Div([
@@ -608,7 +383,8 @@ app.layout = html.Div([
         html.Div([
             html.H2("📊 WOOX Trading Bot - Detailed Report", 
                     style={'textAlign': 'center', 'marginBottom': '20px', 'color': '#667eea', 'borderBottom': '3px solid #667eea', 'paddingBottom': '10px'}),
-            html.P(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}", 
+            # Filled in by the print callback when the report is printed
+            html.P(["Generated: ", html.Span(id='report-ts')], 
                    style={'textAlign': 'center', 'color': '#666', 'fontSize': '14px', 'marginBottom': '30px'}),
             
             # Account Summary Section
@@ -622,6 +398,8 @@ app.layout = html.Div([
     
     # Auto-refresh interval
     dcc.Interval(id='interval-component', interval=1000, n_intervals=0),  # Update every second
+    # Slower tick for the trade analytics, which re-query the account summary
+    dcc.Interval(id='analytics-interval', interval=4000, n_intervals=0),
     # Sync interval loaded from config (default 60s)
     dcc.Interval(id='sync-interval', 
                  interval=int(config_loader.load_config().get('POSITION_REFRESH_RATE', 60)) * 1000, 
@@ -1089,7 +867,8 @@ def control_bot(start_clicks, stop_clicks, close_clicks, print_clicks, n_interva
     return dash.no_update, dash.no_update, alert_content, alert_class, dash.no_update, dash.no_update
 
 
-# Callback: Update status indicator
+# Callback: Update status indicator, strategy info and system metrics
+# (one request per tick for the header and strategy cards)
 @app.callback(
     Output('status-indicator', 'children'),
     Output('mode-indicator', 'children'),
@@ -1098,6 +877,12 @@ def control_bot(start_clicks, stop_clicks, close_clicks, print_clicks, n_interva
     Output('alert-dialog', 'displayed'),
     Output('start-btn', 'style'),
     Output('stop-btn', 'style'),
+    Output('entry-strategy-metric', 'children'),
+    Output('exit-strategy-metric', 'children'),
+    Output('take-profit-metric', 'children'),
+    Output('stop-loss-metric', 'children'),
+    Output('cpu-usage-metric', 'children'),
+    Output('memory-usage-metric', 'children'),
     Input('interval-component', 'n_intervals')
 )
 def update_status(n):
@@ -1149,7 +934,8 @@ def update_status(n):
         mode_text = "PAPER MODE"
         mode_class = "mode-indicator mode-paper"
         
-    return status_child, mode_text, mode_class, robot_class, show_alert, start_style, stop_style
+    return ((status_child, mode_text, mode_class, robot_class, show_alert, start_style, stop_style)
+            + update_strategy_info(n) + update_system_metrics(n))
 
 
 # Callback: Update metrics
@@ -1211,7 +997,7 @@ def update_metrics(n, last_trade_ts):
         
         # Fallback to session change if 24h stats not available
         if not used_24h_stats and len(chart_data['prices']) > 1:
-            old_price = list(chart_data['prices'])[0]
+            old_price = chart_data['prices'].view()[0]
             if old_price:
                 price_change = price - old_price
                 price_change_pct = (price_change / old_price) * 100
@@ -1289,13 +1075,17 @@ def update_metrics(n, last_trade_ts):
         
         # Update chart data
         if price:
-            chart_data['timestamps'].append(datetime.now(timezone.utc))
+            chart_data['timestamps'].append(np.datetime64(time.time_ns() // 1_000_000, 'ms'))
             chart_data['prices'].append(price)
             chart_data['volumes'].append(trader.current_volume or 0)
             
+            # Depth stays aligned with the timestamps; NaN leaves a gap in the chart
             if trader.orderbook:
                 chart_data['bid_depth'].append(trader.orderbook.get('bid_depth', 0))
                 chart_data['ask_depth'].append(trader.orderbook.get('ask_depth', 0))
+            else:
+                chart_data['bid_depth'].append(np.nan)
+                chart_data['ask_depth'].append(np.nan)
         
         return (symbol_label, price_str, price_change_str, price_change_class,
                 position_str, position_size_str,
@@ -1312,14 +1102,7 @@ def update_metrics(n, last_trade_ts):
                 "Error", "Error")
 
 
-# Callback: Update Strategy Info
-@app.callback(
-    Output('entry-strategy-metric', 'children'),
-    Output('exit-strategy-metric', 'children'),
-    Output('take-profit-metric', 'children'),
-    Output('stop-loss-metric', 'children'),
-    Input('interval-component', 'n_intervals')
-)
+# Strategy Info (returned by update_status)
 def update_strategy_info(n):
     try:
         # Load config (it's fast enough)
@@ -1341,28 +1124,16 @@ def update_strategy_info(n):
         return ("--", "--", "--", "--")
 
 
-# Callback: Update System Metrics
-@app.callback(
-    Output('cpu-usage-metric', 'children'),
-    Output('memory-usage-metric', 'children'),
-    Input('interval-component', 'n_intervals')
-)
+# System Metrics (returned by update_status)
 def update_system_metrics(n):
-    try:
-        # Get CPU usage
-        cpu_percent = psutil.cpu_percent(interval=None)
-        
-        # Get Memory usage
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        
-        return (
-            f"{cpu_percent:.1f}%",
-            f"{memory_percent:.1f}%"
-        )
-    except Exception as e:
-        # logger.error(f"Error updating system metrics: {str(e)}")
-        return ("--", "--")
+    # Values come from the sampler thread; None until its first sample
+    cpu_percent = system_usage['cpu']
+    memory_percent = system_usage['memory']
+    
+    return (
+        f"{cpu_percent:.1f}%" if cpu_percent is not None else "--",
+        f"{memory_percent:.1f}%" if memory_percent is not None else "--"
+    )
 
 
 # Callback: Update price chart
@@ -1387,28 +1158,21 @@ def update_price_chart(n):
     
     if len(chart_data['timestamps']) > 0:
         # Filter data for last 5 minutes
-        now = datetime.now(timezone.utc)
-        cutoff = now - timedelta(minutes=5)
-        
-        timestamps = list(chart_data['timestamps'])
-        prices = list(chart_data['prices'])
-        volumes = list(chart_data['volumes'])
-        bid_depth = list(chart_data['bid_depth'])
-        ask_depth = list(chart_data['ask_depth'])
+        cutoff = np.datetime64(time.time_ns() // 1_000_000 - 5 * 60 * 1000, 'ms')
         
-        # Find indices where timestamp >= cutoff
-        indices = [i for i, t in enumerate(timestamps) if t >= cutoff]
+        timestamps = chart_data['timestamps'].view()
+        recent = timestamps >= cutoff
         
-        if indices:
-            filtered_timestamps = [timestamps[i] for i in indices]
-            filtered_prices = [prices[i] for i in indices]
-            filtered_volumes = [volumes[i] for i in indices]
-            filtered_bid_depth = [bid_depth[i] for i in indices]
-            filtered_ask_depth = [ask_depth[i] for i in indices]
+        if recent.any():
+            filtered_timestamps = timestamps[recent]
+            filtered_prices = chart_data['prices'].view()[recent]
+            filtered_volumes = chart_data['volumes'].view()[recent]
+            filtered_bid_depth = chart_data['bid_depth'].view()[recent]
+            filtered_ask_depth = chart_data['ask_depth'].view()[recent]
             
             # Price line
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=filtered_timestamps,
                     y=filtered_prices,
                     mode='lines',
@@ -1422,7 +1186,7 @@ def update_price_chart(n):
             
             # Bid/Ask depth
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=filtered_timestamps,
                     y=filtered_bid_depth,
                     mode='lines',
@@ -1433,7 +1197,7 @@ def update_price_chart(n):
             )
             
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=filtered_timestamps,
                     y=filtered_ask_depth,
                     mode='lines',
@@ -1443,19 +1207,13 @@ def update_price_chart(n):
                 row=3, col=1
             )
             
-            # Volume
-            up_x, up_y = [], []
-            down_x, down_y = [], []
+            # Volume, split on whether the price ticked up (the first bar counts as up)
+            up = np.ones(len(filtered_prices), dtype=bool)
+            up[1:] = filtered_prices[1:] >= filtered_prices[:-1]
+            up_x, up_y = filtered_timestamps[up], filtered_volumes[up]
+            down_x, down_y = filtered_timestamps[~up], filtered_volumes[~up]
             
-            for i in range(len(filtered_prices)):
-                if i == 0 or filtered_prices[i] >= filtered_prices[i-1]:
-                    up_x.append(filtered_timestamps[i])
-                    up_y.append(filtered_volumes[i])
-                else:
-                    down_x.append(filtered_timestamps[i])
-                    down_y.append(filtered_volumes[i])
-            
-            if up_x:
+            if len(up_x):
                 fig.add_trace(go.Bar(
                     x=up_x,
                     y=up_y,
@@ -1463,7 +1221,7 @@ def update_price_chart(n):
                     marker=dict(color='#00c853')
                 ), row=2, col=1)
                 
-            if down_x:
+            if len(down_x):
                 fig.add_trace(go.Bar(
                     x=down_x,
                     y=down_y,
@@ -1472,9 +1230,9 @@ def update_price_chart(n):
                 ), row=2, col=1)
             
             # Set y-axis range for Price chart (row 1) based on filtered min/max
-            if filtered_prices:
-                min_price = min(filtered_prices)
-                max_price = max(filtered_prices)
+            if len(filtered_prices):
+                min_price = filtered_prices.min()
+                max_price = filtered_prices.max()
                 if min_price > 0 and max_price > 0:
                     fig.update_yaxes(range=[min_price * 0.99, max_price * 1.01], row=1, col=1)
     
@@ -1490,7 +1248,8 @@ def update_price_chart(n):
         margin=dict(l=50, r=20, t=40, b=40),
         hovermode='x unified',
         showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        uirevision='price_chart'
     )
     
     return fig
@@ -1608,7 +1367,7 @@ def update_pnl_chart(n):
             loss_data = [p if p < 0 else 0 for p in pnl_data]
             
             # 1. Profit Area (Green)
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=x_axis,
                 y=profit_data,
                 mode='none',
@@ -1619,7 +1378,7 @@ def update_pnl_chart(n):
             ))
             
             # 2. Loss Area (Red)
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=x_axis,
                 y=loss_data,
                 mode='none',
@@ -1630,7 +1389,7 @@ def update_pnl_chart(n):
             ))
             
             # 3. Main Line
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=x_axis,
                 y=pnl_data,
                 mode='lines',
@@ -1719,33 +1478,7 @@ def update_rsi_chart(n):
             rsi_values = []
             
             if len(prices_resampled) >= period + 1:
-                # Calculate deltas
-                deltas = [prices_resampled[i] - prices_resampled[i-1] for i in range(1, len(prices_resampled))]
-                
-                # Calculate RSI for each point (simple moving average method for simplicity in chart)
-                # For accurate RSI we should use Wilder's Smoothing, but simple SMA is often used for quick visualization
-                # Let's stick to the simple method used before but applied to the window
-                
-                for i in range(len(prices_resampled)):
-                    if i < period:
-                        rsi_values.append(None)
-                        continue
-                        
-                    # Get slice for this window
-                    window_deltas = deltas[i-period : i]
-                    gains = [d if d > 0 else 0 for d in window_deltas]
-                    losses = [-d if d < 0 else 0 for d in window_deltas]
-                    
-                    avg_gain = sum(gains) / period
-                    avg_loss = sum(losses) / period
-                    
-                    if avg_loss != 0:
-                        rs = avg_gain / avg_loss
-                        rsi = 100 - (100 / (1 + rs))
-                    else:
-                        rsi = 100
-                    
-                    rsi_values.append(rsi)
+                rsi_values = rolling_rsi(prices_resampled, period)
             
             # Plotting
             display_limit = 200
@@ -1754,7 +1487,7 @@ def update_rsi_chart(n):
             plot_rsi = rsi_values[-display_limit:]
             
             if len(plot_timestamps) > 0 and len(plot_rsi) > 0:
-                fig.add_trace(go.Scatter(
+                fig.add_trace(go.Scattergl(
                     x=plot_timestamps,
                     y=plot_rsi,
                     mode='lines',
@@ -1784,7 +1517,8 @@ def update_rsi_chart(n):
         height=400,  # Match container height
         margin=dict(l=50, r=20, t=40, b=40),
         hovermode='x unified',
-        yaxis=dict(range=[0, 100])
+        yaxis=dict(range=[0, 100]),
+        uirevision='rsi_chart'
     )
     
     return fig
@@ -1842,24 +1576,8 @@ def update_ma_chart(n):
                 timestamps_resampled = [datetime.fromtimestamp(entry['timestamp'], timezone.utc) for entry in history_list if entry.get('timestamp')]
 
             # Calculate MAs
-            ma_short_values = []
-            ma_long_values = []
-            
-            # Simple Moving Average Calculation
-            for i in range(len(prices_resampled)):
-                # Short MA
-                if i + 1 >= short_period:
-                    ma = sum(prices_resampled[i+1-short_period : i+1]) / short_period
-                    ma_short_values.append(ma)
-                else:
-                    ma_short_values.append(None)
-                
-                # Long MA
-                if i + 1 >= long_period:
-                    ma = sum(prices_resampled[i+1-long_period : i+1]) / long_period
-                    ma_long_values.append(ma)
-                else:
-                    ma_long_values.append(None)
+            ma_short_values = rolling_sma(prices_resampled, short_period)
+            ma_long_values = rolling_sma(prices_resampled, long_period)
             
             # Plotting
             # Limit to last 200 points for better visibility
@@ -1871,7 +1589,7 @@ def update_ma_chart(n):
             plot_ma_long = ma_long_values[-display_limit:]
             
             # Price line
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=plot_timestamps,
                 y=plot_prices,
                 mode='lines',
@@ -1880,7 +1598,7 @@ def update_ma_chart(n):
             ))
             
             # MA Short
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=plot_timestamps,
                 y=plot_ma_short,
                 mode='lines',
@@ -1889,7 +1607,7 @@ def update_ma_chart(n):
             ))
             
             # MA Long
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=plot_timestamps,
                 y=plot_ma_long,
                 mode='lines',
@@ -1914,7 +1632,8 @@ def update_ma_chart(n):
         height=400,  # Match container height
         margin=dict(l=50, r=20, t=40, b=40),
         hovermode='x unified',
-        legend=dict(x=0.01, y=0.99)
+        legend=dict(x=0.01, y=0.99),
+        uirevision='ma_chart'
     )
     
     return fig
@@ -1944,10 +1663,10 @@ def update_spread_chart(n):
             chart_data['spread'].append(spread_pct)
             
             if len(chart_data['timestamps']) > 0 and len(chart_data['spread']) > 0:
-                spread_values = list(chart_data['spread'])[-len(chart_data['timestamps']):]
+                spread_values = chart_data['spread'].view()[-len(chart_data['timestamps']):]
                 
-                fig.add_trace(go.Scatter(
-                    x=list(chart_data['timestamps'])[-len(spread_values):],
+                fig.add_trace(go.Scattergl(
+                    x=chart_data['timestamps'].view()[-len(spread_values):],
                     y=spread_values,
                     mode='lines',
                     name='Spread %',
@@ -1978,7 +1697,7 @@ def update_spread_chart(n):
 # Callback: Update Trade Distribution chart
 @app.callback(
     Output('trade-distribution-chart', 'figure'),
-    Input('interval-component', 'n_intervals')
+    Input('analytics-interval', 'n_intervals')
 )
 def update_trade_distribution_chart(n):
     global trader
@@ -2035,7 +1754,7 @@ def update_trade_distribution_chart(n):
 # Callback: Update Cumulative Return chart
 # @app.callback(
 #     Output('cumulative-return-chart', 'figure'),
-#     Input('interval-component', 'n_intervals')
+#     Input('analytics-interval', 'n_intervals')
 # )
 def update_cumulative_return_chart(n):
     global trader, performance_metrics
@@ -2059,9 +1778,9 @@ def update_cumulative_return_chart(n):
                     cumulative_pnl.append(running_total)
                 
                 if cumulative_pnl and len(chart_data['timestamps']) > 0:
-                    timestamps = list(chart_data['timestamps'])[-len(cumulative_pnl):]
+                    timestamps = chart_data['timestamps'].view()[-len(cumulative_pnl):]
                     
-                    fig.add_trace(go.Scatter(
+                    fig.add_trace(go.Scattergl(
                         x=timestamps,
                         y=cumulative_pnl,
                         mode='lines',
@@ -2097,7 +1816,7 @@ def update_cumulative_return_chart(n):
 # Callback: Update performance table
 @app.callback(
     Output('performance-table', 'children'),
-    Input('interval-component', 'n_intervals')
+    Input('analytics-interval', 'n_intervals')
 )
 def update_performance_table(n):
     global trader, performance_metrics
@@ -2374,6 +2093,42 @@ def clear_feedback(n):
     return dash.no_update, dash.no_update, dash.no_update
 
 
+# Log file shown in the activity panel, and the last rendering of it
+ACTIVITY_LOG_FILE = 'trade.log'
+activity_log_cache = {'key': None, 'entries': None}
+
+
+def tail_lines(path, count, block_size=8192):
+    """Return the last lines of a file without reading all of it.
+
+    Reads fixed-size blocks backwards from the end until enough line
+    breaks have been seen, so the cost doesn't grow with the log.
+
+    Args:
+        path: File to read.
+        count: Number of trailing lines to return.
+        block_size: Bytes read per step.
+
+    Returns:
+        list: Up to `count` lines, oldest first, with line endings kept.
+    """
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b''
+        # One extra break covers a trailing newline and the partial first line
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode('utf-8', errors='replace').splitlines(keepends=True)
+    if pos > 0:
+        # Drop the line cut off at the start of the first block read
+        lines = lines[1:]
+    return lines[-count:]
+
+
 # Callback: Update activity log
 @app.callback(
     Output('activity-log', 'children'),
@@ -2382,29 +2137,29 @@ def clear_feedback(n):
 def update_activity_log(n):
     # Read recent log entries
     try:
-        with open('trade.log', 'r') as f:
-            # Use deque to efficiently get the last 20 lines
-            lines = deque(f, maxlen=20)
-            log_entries = []
-            for line in lines:
-                # Color code based on log level
-                if 'ERROR' in line:
-                    color = '#ff5252'
-                elif 'WARNING' in line:
-                    color = '#ffea00'
-                elif 'INFO' in line:
-                    color = '#00e676'
-                else:
-                    color = '#b0b0b0'
-                
-                log_entries.append(html.Div(line.strip(), style={'color': color, 'marginBottom': '5px', 'fontSize': '13px', 'fontFamily': 'monospace'}))
-            
-            # Reverse to show newest at top if desired, but usually logs are top-down. 
-            # If the UI scrolls to bottom, standard order is fine.
-            # The current UI has overflowY: scroll, so it's a scrollable box.
-            # Usually logs are appended.
+        # Rebuild only when trade.log has changed since the last refresh
+        stat = os.stat(ACTIVITY_LOG_FILE)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if activity_log_cache['key'] == cache_key:
+            return activity_log_cache['entries']
+        
+        log_entries = []
+        for line in tail_lines(ACTIVITY_LOG_FILE, 20):
+            # Color code based on log level
+            if 'ERROR' in line:
+                color = '#ff5252'
+            elif 'WARNING' in line:
+                color = '#ffea00'
+            elif 'INFO' in line:
+                color = '#00e676'
+            else:
+                color = '#b0b0b0'
             
-            return log_entries
+            log_entries.append(html.Div(line.strip(), style={'color': color, 'marginBottom': '5px', 'fontSize': '13px', 'fontFamily': 'monospace'}))
+        
+        activity_log_cache['key'] = cache_key
+        activity_log_cache['entries'] = log_entries
+        return log_entries
     except FileNotFoundError:
         return html.Div("No log file found", style={'color': '#888888', 'fontSize': '14px'})
     except Exception as e:
@@ -2890,7 +2645,50 @@ def save_config(n_clicks, trade_mode, trade_type, symbol, pos_size_type, pos_siz
     except Exception as e:
         logger.error(f"Error saving config: {e}")
         return html.Span(f"❌ Error saving settings: {str(e)}", style={'color': '#ff1744'})
+
+
+# Last order-history rows and the state they were loaded from
+trading_records_cache = {'key': None, 'records': None}
+
+
+def file_state(path):
+    """Return (mtime_ns, size) for a file, or None when it doesn't exist."""
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
 def get_trading_records():
+    """Return the order-history rows, reloading them only when they can have changed.
+
+    The cache key covers the trade mode and history window, the DuckDB
+    file and its WAL (one of them changes on every commit), and the
+    current minute so old rows still age out of the window.
+    """
+    try:
+        config = config_loader.load_config()
+    except Exception:
+        # load_trading_records reports config problems itself
+        return load_trading_records()
+    trade_mode = config.get('TRADE_MODE', 'paper')
+    db_file = 'live_transaction.db' if trade_mode == 'live' else 'paper_transaction.db'
+    key = (trade_mode, config.get('ORDER_HISTORY_HOURS', 72),
+           file_state(db_file), file_state(db_file + '.wal'), int(time.time() // 60))
+    
+    if trading_records_cache['key'] == key:
+        return trading_records_cache['records']
+    
+    records = load_trading_records()
+    # Empty results (no data or a failed read) are cheap to retry, so not cached
+    if records:
+        trading_records_cache['key'] = key
+        trading_records_cache['records'] = records
+    return records
+
+
+def load_trading_records():
     try:
         # Determine DB file based on config
         config = config_loader.load_config()
@@ -3148,6 +2946,11 @@ app.clientside_callback(
         if (n_clicks && n_clicks > 0) {
             // Set title to desired filename
             document.title = 'OC_API_bot';
+            // Stamp the report with the print time (UTC)
+            var reportTs = document.getElementById('report-ts');
+            if (reportTs) {
+                reportTs.textContent = new Date().toISOString().slice(0, 19).replace('T', ' ') + ' UTC';
+            }
             // Trigger print
             window.print();
             return null;
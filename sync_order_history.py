@@ -78,6 +78,10 @@ class OrderHistorySync:
                 )
                 """)
                 
+                # Account's summary queries filter on status and sort by the order times
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_status_created ON trades(status, created_time)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_status_updated ON trades(status, updated_time)")
+                
                 logger.info("Database schema created successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
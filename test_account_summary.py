@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the live-schema transaction summary on fractional fills whose
+quantities net to zero (0.1 + 0.2 - 0.3 leaves float residue in the
+running position).
+"""
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import duckdb
+
+from account import Account
+
+# Live trades table layout, as created by OrderHistorySync._init_database
+TRADES_DDL = """
+CREATE TABLE trades (
+    order_id TEXT PRIMARY KEY,
+    client_order_id TEXT,
+    symbol TEXT,
+    order_type TEXT,
+    order_price DOUBLE,
+    order_quantity DOUBLE,
+    order_amount DOUBLE,
+    side TEXT,
+    status TEXT,
+    created_time TIMESTAMP,
+    updated_time TIMESTAMP,
+    executed_quantity DOUBLE,
+    executed_price DOUBLE,
+    fee DOUBLE,
+    fee_asset TEXT,
+    total_fee DOUBLE,
+    visible_quantity DOUBLE,
+    average_executed_price DOUBLE,
+    realized_pnl DOUBLE,
+    trigger_price DOUBLE,
+    reduce_only BOOLEAN,
+    order_tag TEXT,
+    exchange TEXT DEFAULT 'woox'
+)
+"""
+
+# (side, quantity, price): long 0.3 in two fills, close it, then a short round trip
+FILLS = [
+    ('BUY', 0.1, 100.0),
+    ('BUY', 0.2, 100.0),
+    ('SELL', 0.3, 110.0),
+    ('SELL', 0.1, 120.0),
+    ('BUY', 0.1, 110.0),
+]
+
+
+def test_fractional_fills_net_to_flat():
+    """A position closed by fractional fills counts as flat, not as a residual open."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            conn = duckdb.connect('live_transaction.db')
+            conn.execute(TRADES_DDL)
+            start = datetime(2025, 11, 13, 9, 30)
+            for i, (side, qty, price) in enumerate(FILLS):
+                ts = start + timedelta(minutes=i)
+                conn.execute(
+                    "INSERT INTO trades (order_id, symbol, order_type, order_price, side, status, "
+                    "created_time, updated_time, executed_quantity, average_executed_price) "
+                    "VALUES (?, 'PERP_BTC_USDT', 'LIMIT', ?, ?, 'FILLED', ?, ?, ?, ?)",
+                    [str(i + 1), price, side, ts, ts, qty, price]
+                )
+            conn.close()
+
+            account = Account(trade_mode='live')
+            try:
+                summary = account.get_transaction_summary(current_price=130.0)
+            finally:
+                account.close()
+        finally:
+            os.chdir(cwd)
+
+    print(f"Summary: {summary}")
+    assert summary['total_trades'] == 5
+    assert summary['winning_trades'] == 2
+    assert summary['losing_trades'] == 0
+    assert summary['net_quantity'] == 0.0
+    assert summary['unrealized_pnl'] == 0.0
+    assert summary['cash_pnl'] == 4.0
+
+
+if __name__ == "__main__":
+    test_fractional_fills_net_to_flat()
+    print("✅ Fractional fills net to a flat position")
@@ -13,6 +13,7 @@ import functools
 import duckdb
 from decimal import Decimal
 from config_loader import CONFIG, get_config_value, load_config
+from createDuckDB import TRADES_COLUMNS_DDL, TRADES_INDEX_DDL
 from trading_signal import get_strategy
 from account import Account
 from woox_errors import (
@@ -224,23 +225,11 @@ class Trade:
         """Initialize the DuckDB database and create trades table if not exists."""
         try:
             with duckdb.connect(self.db_file) as conn:
-                conn.execute("""
-                CREATE TABLE IF NOT EXISTS trades (
-                    acct_id TEXT,
-                    symbol TEXT,
-                    trade_datetime TIMESTAMP,
-                    exchange TEXT,
-                    signal TEXT,
-                    trade_type TEXT,
-                    quantity DOUBLE,
-                    price DOUBLE,
-                    proceeds DOUBLE,
-                    commission DOUBLE,
-                    fee DOUBLE,
-                    order_type TEXT,
-                    code TEXT
-                )
-                """)
+                conn.execute(f"CREATE TABLE IF NOT EXISTS trades ({TRADES_COLUMNS_DDL})")
+                # The live database gets the order-history schema and its
+                # indexes from OrderHistorySync instead
+                if self.trade_mode != 'live':
+                    conn.execute(TRADES_INDEX_DDL)
             self.logger.info("Database initialized successfully")
         except Exception as e:
             self.logger.error("Error initializing database: %s", str(e))
@@ -284,6 +273,8 @@ class Trade:
             db_file = 'paper_transaction.db'
             
             with duckdb.connect(db_file) as conn:
+                # Trade row and position totals are written in one transaction
+                conn.begin()
                 # Paper Mode Schema
                 conn.execute("""
                 INSERT INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -303,6 +294,19 @@ class Trade:
                     code,  # code (O=Open, C=Close)
                     pnl  # realized_pnl
                 ))
+                
+                # Keep the per-symbol position totals (created by createDuckDB.init_db) in step
+                if conn.execute(
+                    "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'positions_agg'"
+                ).fetchone()[0]:
+                    conn.execute("""
+                    INSERT INTO positions_agg VALUES (?, ?, ?, 1)
+                    ON CONFLICT (symbol) DO UPDATE SET
+                        net_quantity = net_quantity + excluded.net_quantity,
+                        price_sum = price_sum + excluded.price_sum,
+                        trade_count = trade_count + 1
+                    """, (self.symbol, db_quantity, price))
+                conn.commit()
             
             self.logger.info(
                 "Transaction recorded - Type: %s, Quantity: %.6f, Price: %.2f, Proceeds: %.2f",
@@ -1263,18 +1267,17 @@ class Trade:
                             if pos_size_type == 'percentage':
                                 try:
                                     # Get total asset value
-                                    account_helper = Account(trade_mode=self.trade_mode)
                                     total_asset = 0.0
-                                    
-                                    if self.trade_mode == 'live':
-                                        acct_info = account_helper.get_account_info()
-                                        if acct_info and 'totalCollateral' in acct_info:
-                                            total_asset = float(acct_info['totalCollateral'])
-                                    else:
-                                        # Paper mode: Initial 100k + PnL
-                                        summary = account_helper.get_transaction_summary()
-                                        net_pnl = summary.get('net_pnl', 0.0)
-                                        total_asset = 100000.0 + net_pnl
+                                    with Account(trade_mode=self.trade_mode) as account_helper:
+                                        if self.trade_mode == 'live':
+                                            acct_info = account_helper.get_account_info()
+                                            if acct_info and 'totalCollateral' in acct_info:
+                                                total_asset = float(acct_info['totalCollateral'])
+                                        else:
+                                            # Paper mode: Initial 100k + PnL
+                                            summary = account_helper.get_transaction_summary()
+                                            net_pnl = summary.get('net_pnl', 0.0)
+                                            total_asset = 100000.0 + net_pnl
                                         
                                     trade_amount_usd = total_asset * (pos_size_value / 100.0)
                                     self.logger.info(f"Calculated position size: ${trade_amount_usd:.2f} ({pos_size_value}% of ${total_asset:.2f})")